@@ -6,13 +6,43 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
+from .const import (
+    CONF_COMMAND_RATE,
+    CONF_DISPATCH_WINDOW,
+    CONF_LIVENESS_INTERVAL,
+    CONF_MODEL,
+    CONF_POWER_ON_HOLD,
+    CONF_PROXY_PORT,
+    CONF_PUSH_UPDATES,
+    CONF_RECONNECT_MAX_DELAY,
+    CONF_TIMEOUT_MAX,
+    CONF_TIMEOUT_MIN,
+    DEFAULT_COMMAND_RATE,
+    DEFAULT_DISPATCH_WINDOW,
+    DEFAULT_LIVENESS_INTERVAL,
+    DEFAULT_POWER_ON_HOLD,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_RECONNECT_MAX_DELAY,
+    DEFAULT_TIMEOUT_MAX,
+    DEFAULT_TIMEOUT_MIN,
+    DOMAIN,
+    STORAGE_VERSION,
+)
 from .coordinator import McIntoshC2800Coordinator
+from .handoff import async_discard
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER]
+PLATFORMS: list[Platform] = [
+    Platform.MEDIA_PLAYER,
+    Platform.NUMBER,
+    Platform.SELECT,
+    Platform.SENSOR,
+    Platform.SWITCH,
+]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -20,14 +50,56 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
 
-    coordinator = McIntoshC2800Coordinator(hass, host, port)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = McIntoshC2800Coordinator(
+        hass,
+        host,
+        port,
+        entry.entry_id,
+        push_updates=entry.options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES),
+        liveness_interval=entry.options.get(
+            CONF_LIVENESS_INTERVAL, DEFAULT_LIVENESS_INTERVAL
+        ),
+        dispatch_window=(
+            entry.options.get(CONF_DISPATCH_WINDOW, DEFAULT_DISPATCH_WINDOW) / 1000
+        ),
+        reconnect_max_delay=entry.options.get(
+            CONF_RECONNECT_MAX_DELAY, DEFAULT_RECONNECT_MAX_DELAY
+        ),
+        proxy_port=entry.options.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT),
+        command_rate=entry.options.get(CONF_COMMAND_RATE, DEFAULT_COMMAND_RATE),
+        power_on_hold=entry.options.get(CONF_POWER_ON_HOLD, DEFAULT_POWER_ON_HOLD),
+        min_timeout=entry.options.get(CONF_TIMEOUT_MIN, DEFAULT_TIMEOUT_MIN) / 1000,
+        max_timeout=entry.options.get(CONF_TIMEOUT_MAX, DEFAULT_TIMEOUT_MAX) / 1000,
+        model=entry.data.get(CONF_MODEL),
+    )
+    # Entities start from the last known state; the device connection is
+    # established in the background so an unreachable preamplifier does not
+    # hold up Home Assistant startup.
+    await coordinator.async_restore_state()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    coordinator.async_start()
+
+    if coordinator.proxy:
+        await coordinator.proxy.async_start()
+
+    options = dict(entry.options)
+
+    async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Reload the config entry when its options change."""
+        # Storing the detected model updates only the data; the coordinator
+        # already uses it and has removed the other model's entities
+        if entry.options != options:
+            # Keep the device session open for the new setup
+            coordinator.hand_over = True
+            await hass.config_entries.async_reload(entry.entry_id)
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
@@ -35,6 +107,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
-        await coordinator.async_shutdown()
+        # Only a reload keeps the session open; otherwise the device's
+        # single control connection is released at once
+        await coordinator.async_shutdown(hand_over=coordinator.hand_over)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved device state when an entry is deleted."""
+    async_discard(hass, f"{entry.data[CONF_HOST]}:{entry.data[CONF_PORT]}")
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
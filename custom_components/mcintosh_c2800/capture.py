@@ -0,0 +1,83 @@
+"""Ring buffer of the raw bytes exchanged with the device.
+
+The client records every read and write with its monotonic time, keeping
+only the most recent ones. A capture can be written to a text file, one
+record per line:
+
+    0.0213 < (PWR 1)\\r\\n
+    0.0215 > (VOL 30)\\r\\n
+
+The first column is seconds since the first record, ``<`` marks bytes
+received and ``>`` bytes sent, and the rest of the line is the payload with
+control and non-ASCII bytes backslash-escaped, so any byte sequence
+survives the round trip. ``scripts/replay.py`` feeds a capture back through
+the client's receive path.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+import time
+
+INBOUND = "<"
+OUTBOUND = ">"
+
+HEADER = "# McIntosh C2800 capture"
+
+
+class TrafficCapture:
+    """Bounded record of the most recent reads and writes."""
+
+    __slots__ = ("_records",)
+
+    def __init__(self, size: int) -> None:
+        """Initialize a capture keeping at most ``size`` records."""
+        self._records: deque[tuple[float, str, bytes]] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of records kept."""
+        return len(self._records)
+
+    def record(self, direction: str, data: bytes) -> None:
+        """Add the bytes of one read or write."""
+        self._records.append((time.monotonic(), direction, data))
+
+    def clear(self) -> None:
+        """Discard all records."""
+        self._records.clear()
+
+    def lines(self) -> Iterator[str]:
+        """Return the capture in its file format, without line endings."""
+        yield HEADER
+        if not self._records:
+            return
+        first = self._records[0][0]
+        for timestamp, direction, data in list(self._records):
+            yield f"{timestamp - first:.4f} {direction} {_escape(data)}"
+
+
+def parse_capture(lines: Iterable[str]) -> list[tuple[float, str, bytes]]:
+    """Return the (seconds, direction, data) records of a capture file."""
+    records = []
+    for number, line in enumerate(lines, 1):
+        line = line.rstrip("\r\n")
+        if not line or line.startswith("#"):
+            continue
+        try:
+            offset, direction, payload = line.split(" ", 2)
+            if direction not in (INBOUND, OUTBOUND):
+                raise ValueError(f"unknown direction {direction!r}")
+            records.append((float(offset), direction, _unescape(payload)))
+        except ValueError as err:
+            raise ValueError(f"Invalid capture line {number}: {err}") from None
+    return records
+
+
+def _escape(data: bytes) -> str:
+    """Return bytes as printable ASCII with everything else escaped."""
+    return data.decode("latin-1").encode("unicode_escape").decode("ascii")
+
+
+def _unescape(text: str) -> bytes:
+    """Reverse _escape."""
+    return text.encode("ascii").decode("unicode_escape").encode("latin-1")
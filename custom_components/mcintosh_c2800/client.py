@@ -2,69 +2,402 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+import itertools
 import logging
-from typing import Callable
+import random
+import socket
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
-from .const import COMMAND_TIMEOUT
+from .capture import INBOUND, OUTBOUND, TrafficCapture
+from .codec import COMMANDS, FIELDS
+from .const import (
+    CAPTURE_SIZE,
+    COMMAND_TIMEOUT,
+    DEFAULT_COMMAND_BURST,
+    DEFAULT_COMMAND_RATE,
+    DEFAULT_LIVENESS_INTERVAL,
+    DEFAULT_POWER_ON_HOLD,
+    DEFAULT_RECONNECT_MAX_DELAY,
+    DEFAULT_TIMEOUT_MAX,
+    DEFAULT_TIMEOUT_MIN,
+    MAX_DEADLINE_MISSES,
+    POWER_ON_QUEUE_SIZE,
+    POWER_ON_TIMEOUT,
+    RAMP_MAX_IN_FLIGHT,
+    READ_CHUNK_SIZE,
+    RECONNECT_FIRST_DELAY,
+    RECONNECT_MIN_DELAY,
+    TCP_KEEPALIVE_COUNT,
+    TCP_KEEPALIVE_IDLE,
+    TCP_KEEPALIVE_INTERVAL,
+)
+from .framing import FrameBuffer
+from .metrics import ClientMetrics
+from .rtt import RttEstimator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Commands sent to refresh the full device state
+STATUS_QUERIES = ("PWR", "VOL", "MUT", "INP")
+
+# Write priorities, lowest value first: user control, state queries, polling
+PRIORITY_USER = 0
+PRIORITY_QUERY = 1
+PRIORITY_POLL = 2
+PRIORITY_NAMES = {PRIORITY_USER: "user", PRIORITY_QUERY: "query", PRIORITY_POLL: "poll"}
+
+
+class McIntoshC2800CommandError(Exception):
+    """Error reported by the device in reply to a command."""
+
+
+def _consume_result(future: asyncio.Future):
+    """Retrieve the outcome of a future nobody awaits, so it is not logged."""
+    if not future.cancelled():
+        future.exception()
+
+
+def _settled(entry: list, stale_before: float) -> bool:
+    """Return True if a reply slot no longer waits for a reply.
+
+    That is a request that was answered, cancelled or failed, or a write
+    nobody awaits whose reply did not arrive by stale_before.
+    """
+    if entry[1] is None:
+        return entry[3] < stale_before
+    return entry[1].done()
+
+
+def _oldest_written(waiting: deque[list], stale_before: float) -> list | None:
+    """Return the earliest written slot still waiting for a reply, if any."""
+    oldest = None
+    for entry in waiting:
+        if (
+            entry[0] is not None
+            and not _settled(entry, stale_before)
+            and (oldest is None or entry[0] < oldest[0])
+        ):
+            oldest = entry
+    return oldest
+
+
+def reconnect_delay(
+    attempt: int, max_delay: float = DEFAULT_RECONNECT_MAX_DELAY
+) -> float:
+    """Return the delay before a reconnection attempt, counted from 0.
+
+    The first retry is almost immediate to ride out brief drops; later
+    ones back off exponentially up to max_delay, with jitter so that many
+    devices do not retry in lockstep.
+    """
+    if attempt == 0:
+        return RECONNECT_FIRST_DELAY
+    delay = min(RECONNECT_MIN_DELAY * 2 ** (attempt - 1), max_delay)
+    return random.uniform(delay / 2, delay)
+
 
 class McIntoshC2800Client:
     """TCP client for McIntosh C2800 preamplifier."""
 
-    def __init__(self, host: str, port: int, status_callback: Callable | None = None):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        status_callback: Callable[[frozenset[str]], None] | None = None,
+        push_updates: bool = False,
+        dispatch_window: float = 0,
+        liveness_interval: float = DEFAULT_LIVENESS_INTERVAL,
+        command_rate: float = DEFAULT_COMMAND_RATE,
+        command_burst: int = DEFAULT_COMMAND_BURST,
+        power_on_hold: float = DEFAULT_POWER_ON_HOLD,
+        capture_size: int = CAPTURE_SIZE,
+        min_timeout: float = DEFAULT_TIMEOUT_MIN / 1000,
+        max_timeout: float = DEFAULT_TIMEOUT_MAX / 1000,
+    ):
         """Initialize the client."""
         self.host = host
         self.port = port
         self._status_callback = status_callback
+        self._push_updates = push_updates
+        self._dispatch_window = dispatch_window
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._read_task: asyncio.Task | None = None
+        self._watchdog_task: asyncio.Task | None = None
+        self._liveness_interval = liveness_interval
         self._connected = False
-        self._lock = asyncio.Lock()
-        
+        # Set when a connection that stopped answering was dropped, by the
+        # watchdog or after repeated missed deadlines
+        self.link_timed_out = False
+        # Whether the device accepted STA 1 on the current connection
+        self.push_enabled = False
+        # Operations that missed their deadline since the device last replied
+        self._deadline_misses = 0
+        # Writes are queued by priority and sent by a single writer task,
+        # paced by a token bucket of command_rate commands per second
+        self._send_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._send_seq = itertools.count()
+        self._writer_task: asyncio.Task | None = None
+        self._command_rate = command_rate
+        self._command_burst = command_burst
+        self._tokens = float(command_burst)
+        self._tokens_at = 0.0
+        # The device ignores commands while powering up, so after PWR 1 other
+        # writes wait (at most power_on_hold seconds) until it reports PWR 1
+        self._power_on_hold = power_on_hold
+        self._power_up: asyncio.Future | None = None
+        self._power_up_timer: asyncio.TimerHandle | None = None
+        self._held_commands = 0
+        # Reply slots, keyed by command keyword in request order. Entries
+        # are [write sequence, future, monotonic request time, monotonic
+        # write time, command]; the first and fourth are None until the
+        # command has been written. Commands written without awaiting their
+        # reply get a slot with no future, so their replies and errors are
+        # not taken for those of requests written after them
+        self._pending: dict[str, deque[list]] = {}
+        # Awaited requests among them not yet written, so writes only search
+        # the slots when one of their commands may be awaited
+        self._unwritten = 0
+        # Round-trip estimate from query replies, kept across reconnects;
+        # it sets how long connecting, queries and liveness probes may take
+        self.rtt = RttEstimator(min_timeout, max_timeout)
+        # Keywords whose next reply may answer a query that timed out, so
+        # it is not used as a round-trip sample
+        self._ambiguous_replies: set[str] = set()
+        # Monotonic time of the last reply matched to a request. The device
+        # answers in order, so a pipelined query's round trip starts once
+        # the reply ahead of it has arrived
+        self._last_reply = 0.0
+        self._request_seq = itertools.count()
+        # Reply futures of outstanding queries shared by identical requests,
+        # as [future, number of waiting callers]
+        self._shared_queries: dict[str, list] = {}
+        # Monotonic timestamps of the last inbound bytes and unsolicited frame
+        self._last_received = 0.0
+        self._last_push = 0.0
+        # Fields changed since the last status callback, flushed once per burst
+        self._dirty: set[str] = set()
+        self._dirty_frames = 0
+        self._flush_handle: asyncio.Handle | None = None
+        # Latest-wins slots for absolute-value commands, keyed by keyword
+        self._latest_commands: dict[str, str] = {}
+        self._latest_results: dict[str, asyncio.Future] = {}
+        # Running volume fade; cancelled by any newer volume command
+        self._ramp_task: asyncio.Task | None = None
+        self.metrics = ClientMetrics()
+        self._frame_buffer = FrameBuffer()
+        # Recent raw traffic, kept for dump_capture; None when disabled
+        self.capture = TrafficCapture(capture_size) if capture_size > 0 else None
+        self._disconnected_at: float | None = None
+        # Callbacks receiving every raw frame from the device
+        self._frame_listeners: list[Callable[[str], None]] = []
+
         # Current state
-        self._power = False
-        self._volume = 0
-        self._muted = False
-        self._source = None
+        # Device state by field name, decoded through the command table
+        self._state: dict[str, Any] = {
+            "power": False,
+            "volume": 0,
+            "muted": False,
+            "source": None,
+        }
+        self._state_view = MappingProxyType(self._state)
 
     @property
     def connected(self) -> bool:
         """Return connection status."""
         return self._connected
 
-    async def connect(self) -> bool:
-        """Connect to the device."""
+    @property
+    def last_received(self) -> float:
+        """Return the monotonic time data was last received."""
+        return self._last_received
+
+    @property
+    def last_push(self) -> float:
+        """Return the monotonic time of the last unsolicited status frame."""
+        return self._last_push
+
+    async def connect(
+        self,
+        streams: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None = None,
+        received: bytes = b"",
+    ) -> bool:
+        """Connect to the device.
+
+        ``streams`` is a connection to the device that is already open, such
+        as the one the config flow validated or one released by detach(),
+        which is adopted instead of opening a new one. ``received`` holds
+        bytes already read from it that have not been processed.
+        """
         try:
-            _LOGGER.debug("Connecting to %s:%s", self.host, self.port)
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port),
-                timeout=COMMAND_TIMEOUT,
-            )
+            if streams is None:
+                _LOGGER.debug("Connecting to %s:%s", self.host, self.port)
+                try:
+                    self._reader, self._writer = await asyncio.wait_for(
+                        asyncio.open_connection(self.host, self.port),
+                        timeout=self.rtt.timeout,
+                    )
+                except asyncio.TimeoutError:
+                    self.rtt.backoff()
+                    raise
+            else:
+                _LOGGER.debug("Adopting connection to %s:%s", self.host, self.port)
+                self._reader, self._writer = streams
             self._connected = True
+            self.link_timed_out = False
+            self._deadline_misses = 0
+            self._ambiguous_replies.clear()
+            self._last_received = time.monotonic()
+            self.metrics.connects += 1
+            if self._disconnected_at is not None:
+                self.metrics.reconnects += 1
+                self.metrics.downtime += self._last_received - self._disconnected_at
+                self._disconnected_at = None
+            self._enable_keepalive()
             _LOGGER.info("Connected to McIntosh C2800 at %s:%s", self.host, self.port)
-            
+
+            self._frame_buffer.reset()
+            if received:
+                self._handle_data(received)
             # Start background task to read responses
             # Using asyncio.create_task is safe here as this is called from
             # an async context already running on the hass event loop
             self._read_task = asyncio.create_task(self._read_responses())
-            
+            if self._writer_task is None or self._writer_task.done():
+                self._writer_task = asyncio.create_task(self._write_loop())
+            if self._watchdog_task:
+                self._watchdog_task.cancel()
+            self._watchdog_task = asyncio.create_task(self._watchdog())
+
+            frames_in = self.metrics.frames_in
+            self.push_enabled = False
+            if self._push_updates:
+                # Ask the device to transmit state changes on its own
+                try:
+                    await self.request("STA 1", priority=PRIORITY_QUERY)
+                    self.push_enabled = True
+                except (
+                    asyncio.TimeoutError,
+                    McIntoshC2800CommandError,
+                    ConnectionError,
+                ) as err:
+                    _LOGGER.warning("Could not enable status updates: %s", err)
+
             # Query initial status after connection
             _LOGGER.debug("Querying initial status after connection")
-            if not await self.query_status():
-                _LOGGER.warning("Failed to query initial status, but connection established")
-            
+            if not await self.query_status(PRIORITY_QUERY):
+                if self.metrics.frames_in == frames_in:
+                    # Not a single frame came back, so nothing is answering
+                    self._drop_link()
+                else:
+                    _LOGGER.warning(
+                        "Failed to query initial status, but connection established"
+                    )
+            if self.link_timed_out or not self._connected:
+                # Missed deadlines may also have dropped the link meanwhile
+                raise ConnectionError("Device did not answer")
             return True
         except (asyncio.TimeoutError, OSError, ConnectionError) as err:
             _LOGGER.error("Failed to connect to %s:%s: %s", self.host, self.port, err)
             self._connected = False
             return False
 
+    def _enable_keepalive(self):
+        """Let the OS detect a dead peer even while the link is idle."""
+        sock = self._writer.get_extra_info("socket") if self._writer else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in (
+                ("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE),
+                ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL),
+                ("TCP_KEEPCNT", TCP_KEEPALIVE_COUNT),
+            ):
+                # Not every platform supports tuning all of these
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        except OSError as err:
+            _LOGGER.debug("Could not configure TCP keepalive: %s", err)
+
+    async def _watchdog(self):
+        """Probe a silent connection and drop it if the device does not answer.
+
+        A peer that lost power or network leaves the socket open without
+        ever returning data, so the read loop alone would never notice.
+        """
+        try:
+            while self._connected:
+                idle = time.monotonic() - self._last_received
+                if idle < self._liveness_interval:
+                    await asyncio.sleep(self._liveness_interval - idle)
+                    continue
+                try:
+                    await self.request("PWR", priority=PRIORITY_QUERY)
+                except McIntoshC2800CommandError:
+                    pass  # The device answered, so the link is alive
+                except asyncio.TimeoutError:
+                    # Probe again with the backed-off timeout; missed
+                    # deadlines drop the link once they reach the limit
+                    _LOGGER.debug(
+                        "No reply from %s to the liveness probe, now waiting %.2f s",
+                        self.host,
+                        self.rtt.timeout,
+                    )
+                except ConnectionError:
+                    return
+        except asyncio.CancelledError:
+            pass
+
+    def _drop_link(self):
+        """Abort a connection that stopped working so it is re-established."""
+        self.link_timed_out = True
+        self._deadline_misses = 0
+        if self._writer:
+            # The read loop sees EOF and reports the lost connection
+            self._writer.transport.abort()
+
+    def _deadline_missed(self, operation: str):
+        """Count a missed deadline, dropping the link if misses keep coming."""
+        self.metrics.deadline_misses += 1
+        self._deadline_misses += 1
+        _LOGGER.debug("Deadline missed: %s", operation)
+        if self._deadline_misses >= MAX_DEADLINE_MISSES and self._connected:
+            _LOGGER.warning(
+                "%s operations in a row missed their deadline, reconnecting to %s",
+                self._deadline_misses,
+                self.host,
+            )
+            self.metrics.deadline_reconnects += 1
+            self._drop_link()
+
+    def _mark_disconnected(self):
+        """Record that the connection is gone."""
+        if self._connected:
+            self._disconnected_at = time.monotonic()
+        self._connected = False
+        self._end_power_up(False)
+        # Writes still queued can no longer be sent
+        while not self._send_queue.empty():
+            item = self._send_queue.get_nowait()
+            if not item[3].done():
+                item[3].set_result(False)
+
     async def disconnect(self):
         """Disconnect from the device."""
-        self._connected = False
+        self._mark_disconnected()
+
+        if self._watchdog_task:
+            if self._watchdog_task is not asyncio.current_task():
+                self._watchdog_task.cancel()
+            self._watchdog_task = None
+
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
         
         if self._read_task:
             self._read_task.cancel()
@@ -84,169 +417,906 @@ class McIntoshC2800Client:
                 self._writer = None
                 self._reader = None
 
+    async def detach(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter] | None:
+        """Stop using the connection without closing it and return its streams.
+
+        Another client can adopt the session with connect(streams), so a
+        device that accepts a single control session is not dropped and
+        reconnected. Returns None, closing whatever is left, if the
+        connection is not usable.
+        """
+        streams = None
+        if (
+            self._connected
+            and self._writer is not None
+            and not self._writer.transport.is_closing()
+        ):
+            streams = (self._reader, self._writer)
+            self._reader = self._writer = None
+        await self.disconnect()
+        return streams
+
     async def _read_responses(self):
         """Background task to read responses from the device."""
-        buffer = ""
         try:
             while self._connected and self._reader:
                 try:
                     # Read available data
-                    data = await self._reader.read(1024)
+                    data = await self._reader.read(READ_CHUNK_SIZE)
                     if not data:
                         _LOGGER.warning("Connection closed by device")
                         break
-                    
-                    # Decode and add to buffer
-                    buffer += data.decode('ascii', errors='ignore')
-                    
-                    # Process all complete messages in buffer (messages wrapped in parentheses)
-                    while '(' in buffer and ')' in buffer:
-                        start_idx = buffer.find('(')
-                        end_idx = buffer.find(')', start_idx)
-                        
-                        if start_idx != -1 and end_idx != -1:
-                            # Extract message without parentheses
-                            message = buffer[start_idx + 1:end_idx]
-                            # Remove processed message from buffer
-                            buffer = buffer[end_idx + 1:]
-                            
-                            if message:
-                                _LOGGER.debug("Received: (%s)", message)
-                                self._parse_response(message)
-                        else:
-                            # No complete message yet
-                            break
-                    
-                    # Clear buffer if it gets too large (safety measure)
-                    if len(buffer) > 4096:
-                        _LOGGER.warning("Buffer overflow, clearing: %s", buffer[:100])
-                        buffer = ""
-                        
+
+                    self._last_received = time.monotonic()
+                    self._handle_data(data)
+
                 except Exception as err:
                     _LOGGER.error("Error reading response: %s", err)
                     break
         except asyncio.CancelledError:
             pass
         finally:
-            self._connected = False
-            if self._status_callback:
-                self._status_callback()
+            self._mark_disconnected()
+            self._fail_pending(ConnectionError("Connection lost"))
+            self._flush_status()
+
+    def _handle_data(self, data: bytes):
+        """Frame and parse bytes received from the device."""
+        if self.capture is not None:
+            self.capture.record(INBOUND, data)
+        frames = self._frame_buffer
+        metrics = self.metrics
+        metrics.bytes_in += len(data)
+        dropped, overflows = frames.dropped_bytes, frames.overflows
+        for frame in frames.feed(data):
+            metrics.frames_in += 1
+            if frame:
+                message = frame.decode("ascii", errors="ignore")
+                _LOGGER.debug("Received: (%s)", message)
+                for listener in self._frame_listeners:
+                    listener(message)
+                self._parse_response(message)
+        metrics.dropped_bytes += frames.dropped_bytes - dropped
+        metrics.buffer_overflows += frames.overflows - overflows
 
     def _parse_response(self, response: str):
         """Parse a response from the device."""
         # Response is already without parentheses
         response = response.strip()
         
-        parts = response.split()
+        parts = response.split(maxsplit=1)
         if not parts:
             return
-        
+
         command = parts[0].upper()
-        
-        try:
-            if command == "PWR":
-                if len(parts) > 1:
-                    self._power = parts[1] == "1"
-                    if self._status_callback:
-                        self._status_callback()
-            elif command == "VOL":
-                if len(parts) > 1:
-                    self._volume = int(parts[1])
-                    if self._status_callback:
-                        self._status_callback()
-            elif command == "MUT":
-                if len(parts) > 1:
-                    self._muted = parts[1] == "1"
-                    if self._status_callback:
-                        self._status_callback()
-            elif command == "INP":
-                if len(parts) > 1:
-                    self._source = " ".join(parts[1:])
-                    if self._status_callback:
-                        self._status_callback()
-        except (ValueError, IndexError) as err:
-            _LOGGER.debug("Error parsing response '%s': %s", response, err)
-
-    async def _send_command(self, command: str) -> bool:
+        value = parts[1] if len(parts) > 1 else ""
+
+        if command == "ERROR":
+            self.metrics.device_errors += 1
+            self._reject_oldest(McIntoshC2800CommandError(response))
+            return
+
+        spec = COMMANDS.get(command)
+        # Echoes of relative steps (VOL U) carry no value; the new level follows
+        if spec is not None and value and not (
+            spec.step_codes and value in spec.step_codes
+        ):
+            try:
+                decoded = spec.decode(value)
+            except ValueError as err:
+                _LOGGER.debug("Error parsing response '%s': %s", response, err)
+                self.metrics.parse_errors += 1
+            else:
+                if self._power_up is not None and spec.field == "power" and decoded:
+                    self._end_power_up(True)
+                # Repeated reports of the same value (polls, echoes) end here
+                if self._state.get(spec.field) != decoded:
+                    self._state[spec.field] = decoded
+                    self._mark_dirty(spec.field)
+                else:
+                    self.metrics.unchanged_reports += 1
+
+        if not self._resolve(command, value):
+            self._last_push = time.monotonic()
+
+    def _mark_dirty(self, field: str):
+        """Record a changed field and schedule a merged status callback."""
+        self._dirty.add(field)
+        self._dirty_frames += 1
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if self._dispatch_window > 0:
+                self._flush_handle = loop.call_later(
+                    self._dispatch_window, self._flush_status
+                )
+            else:
+                self._flush_handle = loop.call_soon(self._flush_status)
+
+    def _flush_status(self):
+        """Deliver one status callback for everything changed since the last."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        changed = frozenset(self._dirty)
+        if self._dirty_frames > 1:
+            self.metrics.coalesced_frames += self._dirty_frames - 1
+        self.metrics.status_callbacks += 1
+        self.metrics.status_fields += len(changed)
+        self._dirty.clear()
+        self._dirty_frames = 0
+        if self._status_callback:
+            self._status_callback(changed)
+
+    def _expect_reply(self, command: str) -> asyncio.Future:
+        """Register a future for the reply to a command."""
+        future = asyncio.get_running_loop().create_future()
+        keyword = command.split(maxsplit=1)[0].upper()
+        self._pending.setdefault(keyword, deque()).append(
+            [None, future, time.monotonic(), None, command]
+        )
+        self._unwritten += 1
+        return future
+
+    def _discard_reply(self, command: str, future: asyncio.Future):
+        """Stop waiting for the reply to a command."""
+        keyword = command.split(maxsplit=1)[0].upper()
+        shared = self._shared_queries.get(keyword)
+        if shared and shared[0] is future:
+            shared[1] -= 1
+            if shared[1] > 0:
+                return  # Other callers still wait for this reply
+            del self._shared_queries[keyword]
+        if waiting := self._pending.get(keyword):
+            for entry in waiting:
+                if entry[1] is future:
+                    waiting.remove(entry)
+                    if entry[0] is None:
+                        self._unwritten -= 1
+                    break
+        if not future.done():
+            future.cancel()
+        elif not future.cancelled():
+            # Mark a failure set by _fail_pending as retrieved
+            future.exception()
+
+    def _stale_before(self, now: float) -> float:
+        """Return the write time before which an unawaited reply is given up.
+
+        Like a query, it is given up once no reply has arrived for the
+        round-trip based timeout.
+        """
+        limit = now - self.rtt.timeout
+        return limit if self._last_reply < limit else 0.0
+
+    def _resolve(self, keyword: str, value: str) -> bool:
+        """Complete the earliest written request waiting for a keyword.
+
+        A report for a keyword none of whose requests has been written yet
+        completes the oldest of them, as the value is already current.
+        """
+        waiting = self._pending.get(keyword)
+        if not waiting:
+            return False
+        now = time.monotonic()
+        stale_before = self._stale_before(now)
+        while waiting and _settled(waiting[0], stale_before):
+            if waiting.popleft()[0] is None:
+                self._unwritten -= 1
+        if not waiting:
+            return False
+        entry = _oldest_written(waiting, stale_before) or waiting[0]
+        waiting.remove(entry)
+        if entry[0] is None:
+            self._unwritten -= 1
+        _, future, sent_at, written_at, command = entry
+        if future is not None:
+            future.set_result(value)
+        self.metrics.record_latency(keyword, (now - sent_at) * 1000)
+        if written_at is not None and " " not in command:
+            if keyword in self._ambiguous_replies:
+                self._ambiguous_replies.discard(keyword)
+            else:
+                self.rtt.sample(now - max(written_at, self._last_reply))
+        self._last_reply = now
+        self._deadline_misses = 0
+        return True
+
+    def _reject_oldest(self, err: Exception):
+        """Fail the oldest outstanding request with a device error.
+
+        Error messages carry no keyword, but the device answers commands in
+        the order it receives them, so the error belongs to the request
+        written first. Requests still queued, which priority ordering may
+        write later than newer ones, cannot have caused it.
+        """
+        oldest: list | None = None
+        source: deque[list] | None = None
+        stale_before = self._stale_before(time.monotonic())
+        for waiting in self._pending.values():
+            while waiting and _settled(waiting[0], stale_before):
+                if waiting.popleft()[0] is None:
+                    self._unwritten -= 1
+            entry = _oldest_written(waiting, stale_before)
+            if entry is not None and (oldest is None or entry[0] < oldest[0]):
+                oldest, source = entry, waiting
+        if oldest is None:
+            _LOGGER.debug("Unmatched device error: %s", err)
+            return
+        source.remove(oldest)
+        if oldest[1] is None:
+            _LOGGER.debug("Device rejected (%s): %s", oldest[4], err)
+        else:
+            oldest[1].set_exception(err)
+        self._last_reply = time.monotonic()
+        self._deadline_misses = 0
+
+    def _fail_pending(self, err: Exception):
+        """Fail every outstanding request."""
+        for waiting in self._pending.values():
+            for entry in waiting:
+                if entry[1] is not None and not entry[1].done():
+                    entry[1].set_exception(err)
+        self._pending.clear()
+        self._unwritten = 0
+
+    def add_frame_listener(self, listener: Callable[[str], None]) -> Callable[[], None]:
+        """Call listener with every frame received; return a remove function."""
+        self._frame_listeners.append(listener)
+
+        def remove_listener():
+            if listener in self._frame_listeners:
+                self._frame_listeners.remove(listener)
+
+        return remove_listener
+
+    async def send_command(self, command: str, timeout: float = COMMAND_TIMEOUT) -> bool:
+        """Send a raw protocol command without waiting for its reply."""
+        if command.split(maxsplit=1)[:1] == ["VOL"]:
+            self._cancel_ramp()
+        return await self._send_command(command, timeout=timeout)
+
+    async def _send_command(
+        self,
+        command: str,
+        priority: int = PRIORITY_USER,
+        timeout: float = COMMAND_TIMEOUT,
+    ) -> bool:
         """Send a command to the device."""
+        return await self._write([command], priority, timeout)
+
+    async def _write(
+        self,
+        commands: list[str],
+        priority: int = PRIORITY_USER,
+        timeout: float = COMMAND_TIMEOUT,
+    ) -> bool:
+        """Write commands with a single drain, giving up after timeout seconds.
+
+        The deadline starts once any power-up hold has ended.
+        """
+        if not await self._power_gate(commands):
+            return False
+        return await self._enqueue(commands, priority, timeout, timed=True)
+
+    async def _power_gate(self, commands: list[str]) -> bool:
+        """Hold commands while the device powers up; return False to drop them."""
+        if self._power_on_hold > 0:
+            power = [
+                command[3:].strip() for command in commands if command[:3].upper() == "PWR"
+            ]
+            if power:
+                self._track_power(power[-1])
+            elif self._power_up is not None:
+                return await self._hold_for_power_up(commands)
+        return True
+
+    async def _enqueue(
+        self,
+        commands: list[str],
+        priority: int,
+        timeout: float = COMMAND_TIMEOUT,
+        timed: bool = False,
+    ) -> bool:
+        """Write commands now, or queue them behind writes of higher priority.
+
+        Returns False if they could not be written within timeout seconds;
+        commands still queued then are never sent. With ``timed`` the time a
+        queued write takes to complete is recorded as its operation latency;
+        writes made at once are left out, keeping the send path lean.
+        """
         if not self._connected or not self._writer:
-            _LOGGER.warning("Not connected, cannot send command: %s", command)
+            _LOGGER.warning("Not connected, cannot send command: %s", ", ".join(commands))
             return False
-        
-        async with self._lock:
-            try:
+        now = time.monotonic()
+        if self._send_queue.empty() and self._take_token():
+            # Nothing is waiting, so there is no order to keep
+            return await self._write_now(commands, priority, now, now + timeout)
+
+        written = asyncio.get_running_loop().create_future()
+        self._send_queue.put_nowait(
+            (priority, next(self._send_seq), commands, written, now, now + timeout)
+        )
+        try:
+            # On timeout the future is cancelled and the writer skips it
+            return await asyncio.wait_for(written, timeout)
+        except asyncio.TimeoutError:
+            self._deadline_missed(f"({', '.join(commands)}) not sent within {timeout} s")
+            return False
+        finally:
+            if timed:
+                self.metrics.record_operation(
+                    PRIORITY_NAMES[priority], (time.monotonic() - now) * 1000
+                )
+
+    def _track_power(self, value: str):
+        """Start or abandon a power-up for a PWR command about to be sent."""
+        if value == "0":
+            self._end_power_up(False)
+        elif value == "1" and self._power_up is None and not self._state["power"]:
+            loop = asyncio.get_running_loop()
+            self._power_up = loop.create_future()
+            self._power_up_timer = loop.call_later(
+                self._power_on_hold, self._power_up_expired
+            )
+
+    async def _hold_for_power_up(self, commands: list[str]) -> bool:
+        """Wait until the device has powered up; return False if it did not."""
+        if self._held_commands + len(commands) > POWER_ON_QUEUE_SIZE:
+            _LOGGER.warning(
+                "Too many commands waiting for power-up, dropping: %s", ", ".join(commands)
+            )
+            return False
+        self._held_commands += len(commands)
+        self.metrics.held_commands += len(commands)
+        try:
+            return await asyncio.shield(self._power_up)
+        finally:
+            self._held_commands -= len(commands)
+
+    def _power_up_expired(self):
+        """Drop the held writes of a power-up the device never reported."""
+        self._power_up_timer = None
+        if self._held_commands:
+            _LOGGER.warning(
+                "Device did not report power on within %s seconds, dropping %s held commands",
+                self._power_on_hold,
+                self._held_commands,
+            )
+            self.metrics.expired_commands += self._held_commands
+        self._end_power_up(False)
+
+    def _end_power_up(self, powered: bool):
+        """Release the writes held for a power-up: sent if powered, else dropped."""
+        if self._power_up is None:
+            return
+        if self._power_up_timer is not None:
+            self._power_up_timer.cancel()
+            self._power_up_timer = None
+        self._power_up.set_result(powered)
+        self._power_up = None
+
+    async def _write_loop(self):
+        """Write queued commands in priority order at the configured rate."""
+        queue = self._send_queue
+        while True:
+            item = await queue.get()
+            if not self._take_token():
+                # Requeue so that anything more urgent queued meanwhile goes first
+                queue.put_nowait(item)
+                await asyncio.sleep(1 / self._command_rate)
+                continue
+
+            priority, _, commands, written, queued_at, deadline = item
+            if not written.done():
+                result = await self._write_now(commands, priority, queued_at, deadline)
+                # The caller may have given up while the write was draining
+                if not written.done():
+                    written.set_result(result)
+
+    async def _write_now(
+        self, commands: list[str], priority: int, queued_at: float, deadline: float
+    ) -> bool:
+        """Write commands with a single drain, after a token has been taken."""
+        if not self._connected or not self._writer:
+            return False
+
+        now = time.monotonic()
+        self.metrics.record_queue_wait(PRIORITY_NAMES[priority], (now - queued_at) * 1000)
+        writer = self._writer
+        pending = self._pending
+        try:
+            for command in commands:
                 _LOGGER.debug("Sending command: (%s)", command)
-                self._writer.write(f"({command})\r\n".encode('ascii'))
-                await self._writer.drain()
+            # Replies are matched in the order commands are written, which
+            # the priority queue may change from request order
+            for command in commands:
+                keyword = command.split(maxsplit=1)[0].upper()
+                waiting = pending.get(keyword)
+                if waiting is None:
+                    waiting = pending[keyword] = deque()
+                elif self._unwritten and self._mark_written(waiting, command, now):
+                    continue
+                waiting.append([next(self._request_seq), None, now, now, command])
+            payload = "".join(f"({command})\r\n" for command in commands).encode("ascii")
+            writer.write(payload)
+            if self.capture is not None:
+                self.capture.record(OUTBOUND, payload)
+            if self._command_rate > 0:
+                self._tokens -= len(commands) - 1
+            self.metrics.bytes_out += len(payload)
+            self.metrics.frames_out += len(commands)
+            if writer.transport.get_write_buffer_size():
+                # Only a backed-up socket can stall the drain, so only then
+                # is it bounded by the deadline
+                await asyncio.wait_for(writer.drain(), max(deadline - time.monotonic(), 0))
+                # Dropping the connection also releases the drain, unsent
+                return not writer.transport.is_closing()
+            await writer.drain()
+            return True
+        except asyncio.TimeoutError:
+            self._deadline_missed(f"device not reading, ({', '.join(commands)}) stuck")
+            return False
+        except Exception as err:
+            # A link dropped or closed on purpose fails the write as expected
+            log = (
+                _LOGGER.debug
+                if self.link_timed_out or not self._connected
+                else _LOGGER.error
+            )
+            log("Error sending command '(%s)': %s", ", ".join(commands), err)
+            self._mark_disconnected()
+            self._fail_pending(ConnectionError(str(err)))
+            # Notify about connection loss
+            self._flush_status()
+            return False
+
+    def _mark_written(self, waiting: deque[list], command: str, now: float) -> bool:
+        """Number the first unwritten request for a command being written."""
+        for entry in waiting:
+            if entry[0] is None and entry[4] == command:
+                entry[0] = next(self._request_seq)
+                entry[3] = now
+                self._unwritten -= 1
                 return True
-            except Exception as err:
-                _LOGGER.error("Error sending command '(%s)': %s", command, err)
-                self._connected = False
-                # Notify about connection loss
-                if self._status_callback:
-                    self._status_callback()
-                return False
+        return False
+
+    def _take_token(self) -> bool:
+        """Take one token from the rate limiter, if one is available.
+
+        A batch takes one token up front and the rest after it is written,
+        which can leave the bucket in debt so the following writes wait.
+        """
+        if self._command_rate <= 0:
+            return True
+        now = time.monotonic()
+        self._tokens = min(
+            self._command_burst,
+            self._tokens + (now - self._tokens_at) * self._command_rate,
+        )
+        self._tokens_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def _send_latest(self, command: str, timeout: float = COMMAND_TIMEOUT) -> bool:
+        """Send an absolute-value command, keeping only the newest target.
+
+        While a command for the same keyword is awaiting its acknowledgement,
+        newer calls replace the queued value instead of queueing behind it,
+        so only the latest target reaches the device. Every caller receives
+        the result of the command that carried the final value.
+        """
+        keyword = command.split(maxsplit=1)[0].upper()
+        if keyword in self._latest_commands:
+            self.metrics.superseded_commands += 1
+        self._latest_commands[keyword] = command
+
+        if (result := self._latest_results.get(keyword)) is not None:
+            return await asyncio.shield(result)
+
+        result = asyncio.get_running_loop().create_future()
+        self._latest_results[keyword] = result
+        success = False
+        try:
+            while (command := self._latest_commands.get(keyword)) is not None:
+                del self._latest_commands[keyword]
+                # Hold the slot until the device acknowledges the value, so
+                # targets are paced by the device rather than the socket
+                try:
+                    await self.request(command, timeout, PRIORITY_USER)
+                    success = True
+                except (
+                    asyncio.TimeoutError,
+                    McIntoshC2800CommandError,
+                    ConnectionError,
+                ) as err:
+                    _LOGGER.debug("Command (%s) not acknowledged: %s", command, err)
+                    success = False
+        finally:
+            self._latest_commands.pop(keyword, None)
+            del self._latest_results[keyword]
+            result.set_result(success)
+        return success
+
+    async def request(
+        self,
+        command: str,
+        timeout: float = COMMAND_TIMEOUT,
+        priority: int = PRIORITY_QUERY,
+    ) -> str:
+        """Send a command and return the value of the device's reply.
+
+        Raises asyncio.TimeoutError if no reply arrives in time,
+        McIntoshC2800CommandError if the device rejects the command and
+        ConnectionError if the connection is unavailable or lost.
+        """
+        (reply,) = await self.request_many([command], timeout, priority)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    async def request_many(
+        self,
+        commands: list[str],
+        timeout: float = COMMAND_TIMEOUT,
+        priority: int = PRIORITY_QUERY,
+    ) -> list[str | Exception]:
+        """Pipeline commands in one write and await all replies.
+
+        Writing and all replies share a single deadline, which starts once
+        any power-up hold has ended. Replies to queries are given up on
+        sooner, once none has arrived for the round-trip based timeout after
+        the write or the previous reply. Each result is either the reply
+        value or the exception that request() would have raised for it.
+        A query whose reply is already awaited shares that reply instead of
+        being sent again.
+        """
+        # Replies are only expected once the commands may be sent, so frames
+        # reported while they are held are not taken for their replies
+        if not await self._power_gate(commands):
+            return [ConnectionError("Device did not power on") for _ in commands]
+
+        futures = []
+        to_write = []
+        for command in commands:
+            if " " not in command.strip():
+                keyword = command.strip().upper()
+                shared = self._shared_queries.get(keyword)
+                if shared and not shared[0].done():
+                    shared[1] += 1
+                    self.metrics.deduplicated_queries += 1
+                    futures.append(shared[0])
+                    continue
+                future = self._expect_reply(command)
+                self._shared_queries[keyword] = [future, 1]
+            else:
+                future = self._expect_reply(command)
+            futures.append(future)
+            to_write.append(command)
 
-    async def power_on(self) -> bool:
+        started = time.monotonic()
+        try:
+            written = not to_write or await self._enqueue(to_write, priority, timeout)
+            if written:
+                await self._wait_replies(
+                    futures,
+                    started + timeout,
+                    all(" " not in command.strip() for command in commands),
+                )
+        except asyncio.CancelledError:
+            # Nobody will collect these replies any more
+            for command, future in zip(commands, futures):
+                self._discard_reply(command, future)
+            raise
+        if not written:
+            for command, future in zip(commands, futures):
+                self._discard_reply(command, future)
+            if self._connected:
+                return [asyncio.TimeoutError(f"({command}) not sent") for command in commands]
+            return [ConnectionError("Not connected") for _ in commands]
+
+        results: list[str | Exception] = []
+        unanswered = []
+        lost_query = False
+        for command, future in zip(commands, futures):
+            if not future.done():
+                self._discard_reply(command, future)
+                self.metrics.request_timeouts += 1
+                unanswered.append(command)
+                if " " not in command.strip():
+                    self._ambiguous_replies.add(command.strip().upper())
+                    lost_query = True
+                results.append(asyncio.TimeoutError(f"No reply to ({command})"))
+            elif future.cancelled():
+                results.append(ConnectionError("Request cancelled"))
+            elif (err := future.exception()) is not None:
+                results.append(err)
+            else:
+                results.append(future.result())
+        if unanswered:
+            self._deadline_missed(f"no reply to ({', '.join(unanswered)})")
+            if lost_query:
+                self.rtt.backoff()
+        self.metrics.record_operation(
+            PRIORITY_NAMES[priority], (time.monotonic() - started) * 1000
+        )
+        return results
+
+    async def _wait_replies(
+        self, futures: list[asyncio.Future], deadline: float, queries: bool
+    ):
+        """Wait for replies until the deadline, or while queries progress.
+
+        Queries are given up on once the device has sent no reply for the
+        round-trip based timeout since they were written.
+        """
+        written_at = time.monotonic()
+        while True:
+            limit = deadline
+            if queries:
+                limit = min(limit, max(written_at, self._last_reply) + self.rtt.timeout)
+            remaining = limit - time.monotonic()
+            if remaining <= 0:
+                return
+            _, pending = await asyncio.wait(futures, timeout=remaining)
+            if not pending:
+                return
+
+    async def power_on(self, timeout: float = COMMAND_TIMEOUT) -> bool:
         """Turn the device on."""
-        return await self._send_command("PWR 1")
+        return await self._send_command("PWR 1", timeout=timeout)
 
-    async def power_off(self) -> bool:
+    async def power_off(self, timeout: float = COMMAND_TIMEOUT) -> bool:
         """Turn the device off."""
-        return await self._send_command("PWR 0")
+        return await self._send_command("PWR 0", timeout=timeout)
 
-    async def set_volume(self, volume: int) -> bool:
+    async def set_volume(self, volume: int, timeout: float = COMMAND_TIMEOUT) -> bool:
         """Set volume (0-100)."""
-        if 0 <= volume <= 100:
-            return await self._send_command(f"VOL {volume}")
-        return False
+        return await self.set_value("volume", volume, timeout)
 
-    async def volume_up(self) -> bool:
+    async def volume_up(self, timeout: float = COMMAND_TIMEOUT) -> bool:
         """Increase volume by 1%."""
-        return await self._send_command("VOL U")
+        return await self.step("volume", True, timeout)
 
-    async def volume_down(self) -> bool:
+    async def volume_down(self, timeout: float = COMMAND_TIMEOUT) -> bool:
         """Decrease volume by 1%."""
-        return await self._send_command("VOL D")
+        return await self.step("volume", False, timeout)
 
-    async def mute_on(self) -> bool:
+    async def mute_on(self, timeout: float = COMMAND_TIMEOUT) -> bool:
         """Mute the device."""
-        return await self._send_command("MUT 1")
+        return await self.set_value("muted", True, timeout)
 
-    async def mute_off(self) -> bool:
+    async def mute_off(self, timeout: float = COMMAND_TIMEOUT) -> bool:
         """Unmute the device."""
-        return await self._send_command("MUT 0")
+        return await self.set_value("muted", False, timeout)
 
-    async def select_source(self, source: str) -> bool:
+    async def select_source(self, source: str, timeout: float = COMMAND_TIMEOUT) -> bool:
         """Select input source."""
-        return await self._send_command(f"INP {source}")
-
-    async def query_status(self) -> bool:
-        """Query current status."""
-        # Query all status
-        commands = ["PWR", "VOL", "MUT", "INP"]
-        success = True
-        for cmd in commands:
-            if not await self._send_command(cmd):
-                success = False
-        return success
+        return await self.set_value("source", source, timeout)
+
+    async def set_value(
+        self, field: str, value: Any, timeout: float = COMMAND_TIMEOUT
+    ) -> bool:
+        """Set a parameter from the command table to an absolute value."""
+        if field == "volume":
+            self._cancel_ramp()
+        try:
+            command = FIELDS[field].command(value)
+        except (KeyError, ValueError) as err:
+            _LOGGER.warning("Cannot set %s to %r: %s", field, value, err)
+            return False
+        return await self._send_latest(command, timeout)
+
+    async def step(
+        self, field: str, up: bool = True, timeout: float = COMMAND_TIMEOUT
+    ) -> bool:
+        """Move a parameter one step up or down."""
+        spec = FIELDS[field]
+        if spec.step_codes is None:
+            _LOGGER.warning("%s cannot be stepped", field)
+            return False
+        if field == "volume":
+            self._cancel_ramp()
+        return await self._send_command(
+            f"{spec.keyword} {spec.step_codes[not up]}", timeout=timeout
+        )
+
+    async def query(self, field: str, timeout: float = COMMAND_TIMEOUT) -> Any:
+        """Read a parameter from the device and return its decoded value."""
+        await self.request(FIELDS[field].keyword, timeout)
+        return self._state.get(field)
+
+    async def apply_state(
+        self,
+        power: bool | None = None,
+        source: str | None = None,
+        volume: int | None = None,
+        muted: bool | None = None,
+        timeout: float = COMMAND_TIMEOUT,
+    ) -> bool:
+        """Apply any combination of power, source, volume and mute at once.
+
+        Returns True when the device has acknowledged every target. Power
+        goes first: the device rejects other commands while it is off, so
+        when it has to be switched on the remaining targets follow its
+        acknowledgement. They are then pipelined in a single write, source
+        before volume and mute.
+        """
+        if power is False:
+            try:
+                await self.request("PWR 0", timeout, PRIORITY_USER)
+            except (asyncio.TimeoutError, McIntoshC2800CommandError, ConnectionError) as err:
+                _LOGGER.warning("Device did not power off: %s", err)
+                return False
+            return True
+
+        targets = {"source": source, "volume": volume, "muted": muted}
+        try:
+            commands = [
+                FIELDS[field].command(value)
+                for field, value in targets.items()
+                if value is not None
+            ]
+        except ValueError as err:
+            _LOGGER.warning("Cannot apply state: %s", err)
+            return False
+        if volume is not None:
+            self._cancel_ramp()
+
+        if power and not self.power:
+            try:
+                await self.request("PWR 1", POWER_ON_TIMEOUT, PRIORITY_USER)
+            except (asyncio.TimeoutError, McIntoshC2800CommandError, ConnectionError) as err:
+                _LOGGER.warning("Device did not power on: %s", err)
+                return False
+        if not commands:
+            return True
+
+        replies = await self.request_many(commands, timeout, PRIORITY_USER)
+        failed = [
+            f"{command}: {reply}"
+            for command, reply in zip(commands, replies)
+            if isinstance(reply, Exception)
+        ]
+        if failed:
+            _LOGGER.warning("Device did not confirm %s", ", ".join(failed))
+        return not failed
+
+    async def ramp_volume(self, target: int, duration: float) -> bool:
+        """Fade the volume to target over duration seconds.
+
+        Returns True once the device has acknowledged the target, or False
+        if the fade failed or was cancelled by a newer volume command.
+        """
+        if not 0 <= target <= 100:
+            return False
+        self._cancel_ramp()
+        self._ramp_task = asyncio.create_task(self._ramp(target, duration))
+        return await self._ramp_task
+
+    def _cancel_ramp(self):
+        """Stop a running volume fade where it is."""
+        if self._ramp_task and not self._ramp_task.done():
+            _LOGGER.debug("Volume ramp cancelled by a newer volume command")
+            self._ramp_task.cancel()
+        self._ramp_task = None
+
+    async def _ramp(self, target: int, duration: float) -> bool:
+        """Send the volume steps of a fade, paced by the device's echoes.
+
+        The level due at any moment is interpolated from the elapsed time,
+        and at most RAMP_MAX_IN_FLIGHT commands wait for their echo. When
+        the device acknowledges more slowly than the schedule, intermediate
+        levels are skipped rather than delayed, so the fade still ends on
+        time and always ends with the exact target.
+        """
+        start = self.volume
+        distance = target - start
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        step_time = duration / abs(distance) if distance else 0
+        in_flight: deque[asyncio.Future] = deque()
+        last_sent = start
+        try:
+            while True:
+                elapsed = loop.time() - started
+                if elapsed >= duration or not distance:
+                    due = target
+                else:
+                    due = start + int(distance * elapsed / duration)
+                if due != last_sent and len(in_flight) < RAMP_MAX_IN_FLIGHT:
+                    command = f"VOL {due}"
+                    if not await self._power_gate([command]):
+                        return False
+                    echo = self._expect_reply(command)
+                    try:
+                        written = await self._enqueue(
+                            [command], PRIORITY_USER, COMMAND_TIMEOUT
+                        )
+                    except asyncio.CancelledError:
+                        # Cancelled while queued: the level is never sent
+                        self._discard_reply(command, echo)
+                        raise
+                    if not written:
+                        self._discard_reply(command, echo)
+                        return False
+                    in_flight.append(echo)
+                    last_sent = due
+                if last_sent == target:
+                    break
+
+                # Wake for the next level or an echo that frees the window
+                if len(in_flight) < RAMP_MAX_IN_FLIGHT:
+                    next_step = started + (abs(due - start) + 1) * step_time
+                    timeout = max(next_step - loop.time(), 0)
+                else:
+                    timeout = COMMAND_TIMEOUT
+                if not in_flight:
+                    await asyncio.sleep(timeout)
+                    continue
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done and len(in_flight) == RAMP_MAX_IN_FLIGHT:
+                    _LOGGER.warning("Volume ramp stopped: no echo from the device")
+                    self.metrics.request_timeouts += 1
+                    self._deadline_missed("no echo during volume ramp")
+                    return False
+                while in_flight and in_flight[0].done():
+                    in_flight.popleft().result()
+
+            # asyncio.wait leaves the echoes pending, so late ones still pair up
+            if in_flight:
+                await asyncio.wait(in_flight, timeout=COMMAND_TIMEOUT)
+                while in_flight:
+                    echo = in_flight.popleft()
+                    if not echo.done():
+                        raise asyncio.TimeoutError(f"No echo of VOL {target}")
+                    echo.result()
+            return True
+        except asyncio.CancelledError:
+            return False
+        except (asyncio.TimeoutError, McIntoshC2800CommandError, ConnectionError) as err:
+            _LOGGER.warning("Volume ramp to %s failed: %s", target, err)
+            return False
+        finally:
+            # Echoes still on their way resolve these; nobody awaits them
+            for echo in in_flight:
+                echo.add_done_callback(_consume_result)
+
+    async def query_status(self, priority: int = PRIORITY_POLL) -> bool:
+        """Query current status and wait for the device to answer."""
+        replies = await self.request_many(list(STATUS_QUERIES), priority=priority)
+        # A device error still is an answer (e.g. VOL while powered off)
+        return not any(
+            isinstance(reply, (asyncio.TimeoutError, ConnectionError))
+            for reply in replies
+        )
+
+    @property
+    def state(self) -> Mapping[str, Any]:
+        """Return a read-only view of every parameter reported so far."""
+        return self._state_view
 
     @property
     def power(self) -> bool:
         """Return power state."""
-        return self._power
+        return self._state["power"]
 
     @property
     def volume(self) -> int:
         """Return current volume (0-100)."""
-        return self._volume
+        return self._state["volume"]
 
     @property
     def is_muted(self) -> bool:
         """Return mute state."""
-        return self._muted
+        return self._state["muted"]
 
     @property
     def source(self) -> str | None:
         """Return current source."""
-        return self._source
+        return self._state["source"]
@@ -0,0 +1,195 @@
+"""Declarative table of the C55/C2800 control protocol commands.
+
+Each parameter the device reports is described once, with its keyword, the
+state field it maps to, its value type and range, and how values convert
+between protocol text and Python values. The client decodes received frames
+with a single dictionary lookup on the keyword and builds commands from the
+same entries, so supporting another parameter only means adding a row.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+# Value types
+BOOL = "bool"  # 1 -> On, 0 -> Off
+INTEGER = "int"  # signed level, optionally scaled (e.g. half-dB steps)
+ENUM = "enum"  # protocol code mapped to a label
+TEXT = "text"  # passed through unchanged
+
+MODEL_C55 = "C55"
+MODEL_C2800 = "C2800"
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """One protocol parameter and the conversion of its values."""
+
+    keyword: str
+    field: str
+    kind: str
+    minimum: int | None = None  # protocol range, before scaling
+    maximum: int | None = None
+    scale: float = 1  # value units per protocol step, e.g. 0.5 dB
+    options: dict[str, str] | None = None  # protocol code -> label
+    step_codes: tuple[str, str] | None = None  # relative (up, down) parameters
+    settable: bool = True
+    model: str | None = None  # only supported by this model
+
+    def supported_by(self, model: str | None) -> bool:
+        """Return False only if ``model`` is known and lacks this parameter."""
+        return self.model is None or model is None or self.model == model
+
+    def decode(self, raw: str) -> Any:
+        """Convert a reported protocol value, raising ValueError if invalid."""
+        return _DECODERS[self.kind](self, raw)
+
+    def encode(self, value: Any) -> str:
+        """Convert a value to its protocol text, raising ValueError if invalid."""
+        if not self.settable:
+            raise ValueError(f"{self.keyword} is read-only")
+        if self.kind == BOOL:
+            return "1" if value else "0"
+        if self.kind == INTEGER:
+            raw = round(value / self.scale)
+            if not self.minimum <= raw <= self.maximum:
+                raise ValueError(f"{self.keyword} value {value} is out of range")
+            return str(raw)
+        if self.kind == ENUM:
+            for code, label in self.options.items():
+                if value in (label, code):
+                    return code
+            raise ValueError(f"Unknown {self.keyword} value {value!r}")
+        return str(value)
+
+    def command(self, value: Any) -> str:
+        """Return the command setting this parameter to ``value``."""
+        return f"{self.keyword} {self.encode(value)}"
+
+
+def _decode_bool(spec: CommandSpec, raw: str) -> bool:
+    """Decode an On/Off parameter."""
+    if raw == "1":
+        return True
+    if raw == "0":
+        return False
+    raise ValueError(f"{spec.keyword} expects 0 or 1, got {raw!r}")
+
+
+def _decode_integer(spec: CommandSpec, raw: str) -> float:
+    """Decode a level, applying the step scale."""
+    return int(raw) if spec.scale == 1 else int(raw) * spec.scale
+
+
+def _decode_enum(spec: CommandSpec, raw: str) -> str:
+    """Decode an indexed choice to its label."""
+    try:
+        return spec.options[raw]
+    except KeyError:
+        raise ValueError(f"Unknown {spec.keyword} value {raw!r}") from None
+
+
+def _decode_text(spec: CommandSpec, raw: str) -> str:
+    """Keep a value as reported."""
+    return raw
+
+
+# Decoder per value type, so decoding is one lookup rather than a chain of tests
+_DECODERS = {
+    BOOL: _decode_bool,
+    INTEGER: _decode_integer,
+    ENUM: _decode_enum,
+    TEXT: _decode_text,
+}
+
+
+def _numbered(*labels: str, first: int = 1) -> dict[str, str]:
+    """Map consecutive protocol codes to labels."""
+    return {str(code): label for code, label in enumerate(labels, first)}
+
+
+UP_DOWN = ("U", "D")
+
+COMMAND_SPECS = (
+    # Core
+    CommandSpec("PWR", "power", BOOL),
+    CommandSpec("VOL", "volume", INTEGER, 0, 100, step_codes=UP_DOWN),
+    CommandSpec("MUT", "muted", BOOL),
+    CommandSpec("OP1", "output_1", BOOL),
+    CommandSpec("OP2", "output_2", BOOL),
+    CommandSpec(
+        "HPS",
+        "headphones",
+        ENUM,
+        options=_numbered("unplugged", "plugged", "no_jack", first=0),
+        settable=False,
+    ),
+    # The input number is kept as reported; INPUT_SOURCE_MAP names it
+    CommandSpec("INP", "source", TEXT, step_codes=UP_DOWN),
+    # Trim
+    CommandSpec("TBA", "balance", INTEGER, -50, 50, step_codes=("R", "L")),
+    CommandSpec("TIN", "input_trim", INTEGER, -12, 12, scale=0.5, step_codes=UP_DOWN),
+    CommandSpec("TMO", "mono", BOOL),
+    CommandSpec("TPL", "processor_loop", BOOL),
+    CommandSpec("TML", "meter_lights", BOOL),
+    CommandSpec(
+        "TDB", "display_brightness", ENUM, options=_numbered("25%", "50%", "75%", "100%")
+    ),
+    CommandSpec(
+        "TPC",
+        "phono_capacitance",
+        ENUM,
+        options=_numbered(*(f"{value}pF" for value in range(50, 450, 50))),
+        step_codes=UP_DOWN,
+    ),
+    CommandSpec(
+        "TPR",
+        "phono_resistance",
+        ENUM,
+        options=_numbered("25", "50", "100", "200", "400", "1k", "47k"),
+        step_codes=UP_DOWN,
+    ),
+    CommandSpec(
+        "TPG",
+        "phono_gain",
+        ENUM,
+        options=_numbered("40dB", "46dB", "52dB", "58dB", "64dB"),
+        step_codes=UP_DOWN,
+    ),
+    CommandSpec("THH", "hxd", BOOL),
+    # Output
+    CommandSpec(
+        "OSM",
+        "output_1_mode",
+        ENUM,
+        options=_numbered(
+            "switched", "unswitched", "bi_amped_fixed", "bi_amped_split", first=0
+        ),
+    ),
+    CommandSpec("OTR", "output_1_trim", INTEGER, -12, 6, scale=0.5, step_codes=UP_DOWN),
+    CommandSpec(
+        "OCF", "crossover_frequency", ENUM, options=_numbered("150Hz", "350Hz", "900Hz")
+    ),
+    CommandSpec(
+        "OHP",
+        "high_pass",
+        ENUM,
+        options=_numbered("bypass", "50Hz", "100Hz", "250Hz", first=0),
+    ),
+    CommandSpec("OLP", "low_pass", ENUM, options=_numbered("600Hz", "1200Hz", "3000Hz")),
+    CommandSpec("ODM", "dual_mono", BOOL),
+    # Information
+    CommandSpec("DAM", "audio_format", TEXT, settable=False),
+    # Model specific
+    CommandSpec("TEQ", "equalizer", BOOL, model=MODEL_C55),
+    CommandSpec("TTN", "tone_control", BOOL, model=MODEL_C2800),
+    CommandSpec("TTB", "bass", INTEGER, -12, 12, step_codes=UP_DOWN, model=MODEL_C2800),
+    CommandSpec("TTT", "treble", INTEGER, -12, 12, step_codes=UP_DOWN, model=MODEL_C2800),
+    CommandSpec("TTL", "tube_lights", BOOL, model=MODEL_C2800),
+)
+
+# Lookup by protocol keyword, used to decode received frames
+COMMANDS: dict[str, CommandSpec] = {spec.keyword: spec for spec in COMMAND_SPECS}
+
+# Lookup by state field, used to build commands and queries
+FIELDS: dict[str, CommandSpec] = {spec.field: spec for spec in COMMAND_SPECS}
@@ -2,69 +2,295 @@
 from __future__ import annotations
 
 import asyncio
+from ipaddress import IPv4Address, IPv4Network, ip_network
 import logging
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components import network
 from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .client import McIntoshC2800Client
-from .const import DEFAULT_PORT, DOMAIN
+from .const import (
+    CONF_COMMAND_RATE,
+    CONF_DISPATCH_WINDOW,
+    CONF_LIVENESS_INTERVAL,
+    CONF_POWER_ON_HOLD,
+    CONF_PROXY_PORT,
+    CONF_PUSH_UPDATES,
+    CONF_RECONNECT_MAX_DELAY,
+    CONF_TIMEOUT_MAX,
+    CONF_TIMEOUT_MIN,
+    DEFAULT_COMMAND_RATE,
+    DEFAULT_DISPATCH_WINDOW,
+    DEFAULT_LIVENESS_INTERVAL,
+    DEFAULT_POWER_ON_HOLD,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_PORT,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_RECONNECT_MAX_DELAY,
+    DEFAULT_TIMEOUT_MAX,
+    DEFAULT_TIMEOUT_MIN,
+    DISCOVERY_MAX_HOSTS,
+    DOMAIN,
+)
+from .discovery import (
+    DiscoveredDevice,
+    ProbedConnection,
+    async_open_probe,
+    async_scan,
+    local_network,
+)
+from .handoff import async_park
 
 _LOGGER = logging.getLogger(__name__)
 
-STEP_USER_DATA_SCHEMA = vol.Schema(
+STEP_MANUAL_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
         vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
     }
 )
 
+CONF_NETWORK = "network"
+
+STEP_DISCOVERY_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_NETWORK, default=""): str,
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+    }
+)
+
 
 class McIntoshC2800ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for McIntosh C2800."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered: dict[str, DiscoveredDevice] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> McIntoshC2800OptionsFlow:
+        """Get the options flow for this handler."""
+        return McIntoshC2800OptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["discovery", "manual"])
+
+    async def async_step_discovery(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Search a network for devices answering on the control port."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            cidr = user_input[CONF_NETWORK].strip()
+            if not cidr:
+                networks = await self._async_local_networks()
+            else:
+                try:
+                    networks = [ip_network(cidr, strict=False)]
+                except ValueError:
+                    networks = []
+                if not networks or not isinstance(networks[0], IPv4Network):
+                    errors[CONF_NETWORK] = "invalid_network"
+                elif networks[0].num_addresses > DISCOVERY_MAX_HOSTS:
+                    errors[CONF_NETWORK] = "network_too_large"
+
+            if not errors:
+                # Configured devices are skipped: their only control
+                # connection is taken by the integration
+                devices = await async_scan(
+                    networks,
+                    user_input[CONF_PORT],
+                    exclude=(
+                        entry.data[CONF_HOST] for entry in self._async_current_entries()
+                    ),
+                )
+                if devices:
+                    self._discovered = {
+                        f"{device.host}:{device.port}": device for device in devices
+                    }
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="discovery",
+            data_schema=STEP_DISCOVERY_DATA_SCHEMA,
+            errors=errors,
+        )
+
+    async def _async_local_networks(self) -> list[IPv4Network]:
+        """Return the networks of the enabled network adapters."""
+        networks = []
+        for adapter in await network.async_get_adapters(self.hass):
+            if not adapter["enabled"]:
+                continue
+            for ipv4 in adapter["ipv4"]:
+                if IPv4Address(ipv4["address"]).is_loopback:
+                    continue
+                networks.append(local_network(ipv4["address"], ipv4["network_prefix"]))
+        return networks
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Let the user choose one of the discovered devices."""
+        if user_input is not None:
+            device = self._discovered[user_input[CONF_HOST]]
+            await self.async_set_unique_id(f"{device.host}:{device.port}")
+            self._abort_if_unique_id_configured()
+            # The scan closed its connections; open one for setup to adopt
+            try:
+                connection = await async_open_probe(device.host, device.port)
+            except (OSError, asyncio.TimeoutError):
+                connection = None
+            if connection:
+                self._async_hand_over(connection)
+            return self.async_create_entry(
+                title=f"McIntosh C2800 ({device.host})",
+                data={CONF_HOST: device.host, CONF_PORT: device.port},
+            )
+
+        choices = {
+            key: f"{device.host} ({'on' if device.power else 'standby'})"
+            for key, device in self._discovered.items()
+        }
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema({vol.Required(CONF_HOST): vol.In(choices)}),
+        )
+
+    @callback
+    def _async_hand_over(self, connection: ProbedConnection) -> None:
+        """Keep the validated connection open for the entry's setup."""
+        async_park(
+            self.hass,
+            self.unique_id,
+            connection.reader,
+            connection.writer,
+            connection.received,
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Set up a device at an address entered by the user."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
             host = user_input[CONF_HOST]
             port = user_input[CONF_PORT]
 
-            # Test connection
-            client = McIntoshC2800Client(host, port)
+            # Create unique ID from host; a configured device's only
+            # control session is taken, so check before connecting
+            await self.async_set_unique_id(f"{host}:{port}")
+            self._abort_if_unique_id_configured()
+
+            # Test connection with one power query round trip, allowing the
+            # longest reply time the client would wait for
+            connection = None
             try:
-                if await asyncio.wait_for(client.connect(), timeout=10):
-                    await client.disconnect()
-                    
-                    # Create unique ID from host
-                    await self.async_set_unique_id(f"{host}:{port}")
-                    self._abort_if_unique_id_configured()
-
-                    return self.async_create_entry(
-                        title=f"McIntosh C2800 ({host})",
-                        data=user_input,
-                    )
-                else:
-                    errors["base"] = "cannot_connect"
+                connection = await async_open_probe(
+                    host, port, timeout=DEFAULT_TIMEOUT_MAX / 1000
+                )
             except asyncio.TimeoutError:
                 errors["base"] = "timeout"
+            except OSError:
+                errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
-            finally:
-                await client.disconnect()
+            else:
+                if connection is None:
+                    errors["base"] = "cannot_connect"
+
+            if connection:
+                self._async_hand_over(connection)
+                return self.async_create_entry(
+                    title=f"McIntosh C2800 ({host})",
+                    data=user_input,
+                )
 
         return self.async_show_form(
-            step_id="user",
-            data_schema=STEP_USER_DATA_SCHEMA,
+            step_id="manual",
+            data_schema=STEP_MANUAL_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class McIntoshC2800OptionsFlow(config_entries.OptionsFlow):
+    """Handle options for McIntosh C2800."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_PUSH_UPDATES,
+                        default=options.get(CONF_PUSH_UPDATES, DEFAULT_PUSH_UPDATES),
+                    ): bool,
+                    vol.Optional(
+                        CONF_LIVENESS_INTERVAL,
+                        default=options.get(
+                            CONF_LIVENESS_INTERVAL, DEFAULT_LIVENESS_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                    vol.Optional(
+                        CONF_DISPATCH_WINDOW,
+                        default=options.get(
+                            CONF_DISPATCH_WINDOW, DEFAULT_DISPATCH_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                    vol.Optional(
+                        CONF_RECONNECT_MAX_DELAY,
+                        default=options.get(
+                            CONF_RECONNECT_MAX_DELAY, DEFAULT_RECONNECT_MAX_DELAY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Optional(
+                        CONF_PROXY_PORT,
+                        default=options.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+                    vol.Optional(
+                        CONF_COMMAND_RATE,
+                        default=options.get(CONF_COMMAND_RATE, DEFAULT_COMMAND_RATE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+                    vol.Optional(
+                        CONF_POWER_ON_HOLD,
+                        default=options.get(CONF_POWER_ON_HOLD, DEFAULT_POWER_ON_HOLD),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=120)),
+                    vol.Optional(
+                        CONF_TIMEOUT_MIN,
+                        default=options.get(CONF_TIMEOUT_MIN, DEFAULT_TIMEOUT_MIN),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=50, max=5000)),
+                    vol.Optional(
+                        CONF_TIMEOUT_MAX,
+                        default=options.get(CONF_TIMEOUT_MAX, DEFAULT_TIMEOUT_MAX),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=500, max=60000)),
+                }
+            ),
+        )
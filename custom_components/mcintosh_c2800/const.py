@@ -2,8 +2,58 @@
 
 DOMAIN = "mcintosh_c2800"
 DEFAULT_PORT = 84
-RECONNECT_DELAY = 5  # seconds
-COMMAND_TIMEOUT = 5  # seconds
+CONF_MODEL = "model"  # entry data; detected from the parameters the device answers
+RECONNECT_FIRST_DELAY = 0.5  # seconds before the first reconnection attempt
+RECONNECT_MIN_DELAY = 2  # seconds, doubled after each failed attempt
+MAX_DEADLINE_MISSES = 3  # operations timing out in a row before reconnecting
+TCP_KEEPALIVE_IDLE = 10  # seconds idle before the OS sends keepalives
+TCP_KEEPALIVE_INTERVAL = 5  # seconds between keepalives
+TCP_KEEPALIVE_COUNT = 3  # unanswered keepalives before the socket fails
+COMMAND_TIMEOUT = 5  # seconds an operation may take, queueing included
+READ_CHUNK_SIZE = 1024  # bytes per socket read
+POWER_ON_TIMEOUT = 20  # seconds the device may take to acknowledge PWR 1
+POWER_ON_QUEUE_SIZE = 32  # commands held at most while the device powers up
+RAMP_MAX_IN_FLIGHT = 2  # volume ramp commands sent ahead of their echoes
+OPTIMISTIC_TIMEOUT = 3  # seconds to wait for the device to confirm a change
+POLL_INTERVAL = 10  # seconds between polls when push updates are not used
+MAX_FRAME_LENGTH = 1024  # longest partial frame kept while waiting for ")"
+DISCOVERY_TIMEOUT = 1.0  # seconds a scanned host has to answer the power query
+DISCOVERY_CONCURRENCY = 128  # hosts probed at the same time
+DISCOVERY_MAX_HOSTS = 1024  # largest network scanned
+HANDOFF_TIMEOUT = 15  # seconds an open connection waits for its entry to be set up
+CAPTURE_SIZE = 2000  # most recent reads and writes kept for dump_capture
+STORAGE_VERSION = 1
+STATE_SAVE_DELAY = 10  # seconds to batch state writes to storage
+
+# Options
+CONF_PUSH_UPDATES = "push_updates"
+CONF_LIVENESS_INTERVAL = "liveness_interval"
+CONF_DISPATCH_WINDOW = "dispatch_window"
+CONF_RECONNECT_MAX_DELAY = "reconnect_max_delay"
+CONF_PROXY_PORT = "proxy_port"
+CONF_COMMAND_RATE = "command_rate"
+CONF_POWER_ON_HOLD = "power_on_hold"
+CONF_TIMEOUT_MIN = "timeout_min"
+CONF_TIMEOUT_MAX = "timeout_max"
+DEFAULT_PUSH_UPDATES = True
+DEFAULT_LIVENESS_INTERVAL = 60  # seconds without inbound data before probing
+DEFAULT_DISPATCH_WINDOW = 0  # ms to merge status frames; 0 merges per loop pass
+DEFAULT_RECONNECT_MAX_DELAY = 60  # seconds between attempts once backed off
+DEFAULT_COMMAND_RATE = 20  # commands per second; 0 disables rate limiting
+DEFAULT_COMMAND_BURST = 8  # commands that may be sent back to back
+DEFAULT_POWER_ON_HOLD = 20  # seconds commands wait for a power-up; 0 sends them at once
+DEFAULT_TIMEOUT_MIN = 250  # ms; lower limit of the round-trip based timeout
+DEFAULT_TIMEOUT_MAX = 5000  # ms; upper limit, used until replies were measured
+DEFAULT_PROXY_PORT = 0  # 0 disables the control proxy
+PROXY_MAX_WRITE_BUFFER = 64 * 1024  # bytes queued for a proxy client before dropping it
+
+# Services
+SERVICE_VOLUME_RAMP = "volume_ramp"
+SERVICE_APPLY_STATE = "apply_state"
+SERVICE_DUMP_CAPTURE = "dump_capture"
+ATTR_POWER = "power"
+ATTR_DURATION = "duration"
+MAX_RAMP_DURATION = 600  # seconds
 
 # Input sources for C2800
 # Protocol uses numbers 1-16 for inputs as per device manual
@@ -2,85 +2,453 @@
 from __future__ import annotations
 
 import asyncio
-import logging
+from collections.abc import Awaitable, Iterable
 from datetime import timedelta
+import logging
+from pathlib import Path
+import time
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .client import McIntoshC2800Client
-from .const import DOMAIN, RECONNECT_DELAY
+from .client import (
+    PRIORITY_POLL,
+    STATUS_QUERIES,
+    McIntoshC2800Client,
+    McIntoshC2800CommandError,
+    reconnect_delay,
+)
+from .codec import COMMANDS, FIELDS
+from .const import (
+    CONF_MODEL,
+    DEFAULT_COMMAND_RATE,
+    DEFAULT_DISPATCH_WINDOW,
+    DEFAULT_LIVENESS_INTERVAL,
+    DEFAULT_POWER_ON_HOLD,
+    DEFAULT_PUSH_UPDATES,
+    DEFAULT_RECONNECT_MAX_DELAY,
+    DEFAULT_TIMEOUT_MAX,
+    DEFAULT_TIMEOUT_MIN,
+    DOMAIN,
+    OPTIMISTIC_TIMEOUT,
+    POLL_INTERVAL,
+    STATE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .handoff import async_claim, async_park
+from .proxy import McIntoshC2800Proxy
+from .state import FIELD_BITS, DeviceState, field_mask
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields shown by the media player and refreshed by every status query
+STATUS_FIELDS = frozenset(COMMANDS[keyword].field for keyword in STATUS_QUERIES)
+
+# Other parameters, each shown by its own entity; read once per power-on
+# and afterwards updated only from the device's status pushes
+PARAMETER_FIELDS = tuple(field for field in FIELDS if field not in STATUS_FIELDS)
+
+STATUS_MASK = field_mask(STATUS_FIELDS)
+
 
 class McIntoshC2800Coordinator(DataUpdateCoordinator):
     """Coordinator to manage McIntosh C2800 updates."""
 
-    def __init__(self, hass: HomeAssistant, host: str, port: int) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        entry_id: str,
+        push_updates: bool = DEFAULT_PUSH_UPDATES,
+        liveness_interval: int = DEFAULT_LIVENESS_INTERVAL,
+        dispatch_window: float = DEFAULT_DISPATCH_WINDOW / 1000,
+        reconnect_max_delay: float = DEFAULT_RECONNECT_MAX_DELAY,
+        proxy_port: int = 0,
+        command_rate: float = DEFAULT_COMMAND_RATE,
+        power_on_hold: float = DEFAULT_POWER_ON_HOLD,
+        min_timeout: float = DEFAULT_TIMEOUT_MIN / 1000,
+        max_timeout: float = DEFAULT_TIMEOUT_MAX / 1000,
+        model: str | None = None,
+    ) -> None:
         """Initialize the coordinator."""
+        # With push updates the device reports its own state changes, so
+        # polling only runs while that stream appears to have stopped.
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=10),
+            update_interval=(
+                None if push_updates else timedelta(seconds=POLL_INTERVAL)
+            ),
         )
+        # Published snapshot; replaced only when a value actually changes
+        self.data: DeviceState = DeviceState()
         self.client = McIntoshC2800Client(
             host=host,
             port=port,
             status_callback=self._handle_status_update,
+            push_updates=push_updates,
+            dispatch_window=dispatch_window,
+            liveness_interval=liveness_interval,
+            command_rate=command_rate,
+            power_on_hold=power_on_hold,
+            min_timeout=min_timeout,
+            max_timeout=max_timeout,
         )
         self._reconnect_task: asyncio.Task | None = None
         self._should_reconnect = True
+        self._reconnect_max_delay = reconnect_max_delay
+        self._push_updates = push_updates
+        # Monotonic time the push stream was declared degraded, or None
+        self._degraded_since: float | None = None
+        # Values shown ahead of the device's confirmation, with their timers
+        self._optimistic: dict[str, Any] = {}
+        self._optimistic_timers: dict[str, asyncio.TimerHandle] = {}
+        # Last confirmed device state, kept across restarts
+        self._entry_id = entry_id
+        # Unique ID of the entry, under which open connections are handed over
+        self._unique_id = f"{host}:{port}"
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self._restored = False
+        self._connect_task: asyncio.Task | None = None
+        # Parameter entities by field; woken only when their field changes
+        self._field_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._parameters_fetched = False
+        # C55 or C2800, or None until detected from the parameters answered
+        self.model = model
+        # Set before the entry reloads, to hand the connection to the new setup
+        self.hand_over = False
+        # Optional local port sharing this connection with other controllers
+        self.proxy = McIntoshC2800Proxy(self.client, proxy_port) if proxy_port else None
+
+    @property
+    def restored(self) -> bool:
+        """Return True while the data was restored from the last run."""
+        return self._restored
+
+    async def async_restore_state(self) -> None:
+        """Load the last confirmed state saved for this device."""
+        if stored := await self._store.async_load():
+            self.data = DeviceState(stored)
+            self._restored = True
+
+    def async_start(self) -> None:
+        """Connect in the background so setup does not wait for the device."""
+        self._connect_task = self.hass.async_create_task(self._async_initial_connect())
+
+    async def _async_initial_connect(self):
+        """Perform the first refresh, keeping restored data if it fails."""
+        await self.async_refresh()
+        if self._restored and not self.last_update_success:
+            # The device is unreachable; stop presenting the saved state
+            self._restored = False
+            self.async_update_listeners()
+            self._notify_fields(self._field_listeners)
+
+    @callback
+    def _save_state(self):
+        """Persist the device's confirmed state after it settles."""
+        self._restored = False
+        self._store.async_delay_save(
+            lambda: dict(self.client.state),
+            STATE_SAVE_DELAY,
+        )
+
+    @property
+    def push_degraded(self) -> bool:
+        """Return True while polling stands in for the push stream."""
+        return self._degraded_since is not None
+
+    def _degrade_push(self, reason: str = "Status stream stopped"):
+        """Fall back to polling while the device is not pushing its state.
+
+        Used after the client's watchdog dropped the link, or when the
+        device did not accept enabling status updates.
+        """
+        if not self._push_updates or self.push_degraded:
+            return
+        _LOGGER.warning("%s, falling back to polling", reason)
+        self._degraded_since = time.monotonic()
+        # Polling starts once the data is published after reconnecting
+        self.update_interval = timedelta(seconds=POLL_INTERVAL)
+
+    def _check_push_enabled(self):
+        """Poll instead if the device refused to push status updates."""
+        if self.client.connected and not self.client.push_enabled:
+            self._degrade_push("Device did not enable status updates")
+
+    def _check_push_recovered(self):
+        """Stop polling once unsolicited frames arrive again."""
+        if self.push_degraded and self.client.last_push > self._degraded_since:
+            _LOGGER.info("Status stream recovered, polling disabled")
+            self._degraded_since = None
+            self.update_interval = None
 
     async def _async_update_data(self):
         """Fetch data from the device."""
+        connected_now = False
         if not self.client.connected:
-            # Try to connect if not connected
+            # Try to connect if not connected, adopting the connection the
+            # config flow or the previous setup left open
+            parked = async_claim(self.hass, self._unique_id)
             try:
-                if not await self.client.connect():
+                if parked:
+                    connected_now = await self.client.connect(
+                        (parked.reader, parked.writer), parked.received
+                    )
+                else:
+                    connected_now = await self.client.connect()
+                if not connected_now:
                     # Trigger reconnection attempt
                     self._schedule_reconnect()
                     raise UpdateFailed("Not connected to device")
+                self._check_push_enabled()
             except Exception as err:
                 _LOGGER.error("Connection failed: %s", err)
                 self._schedule_reconnect()
                 raise UpdateFailed(f"Connection failed: {err}")
-        
-        # Query status
+
+        # Query status; connecting has just done so
+        if not connected_now:
+            try:
+                if not await self.client.query_status():
+                    raise UpdateFailed("Failed to query device status")
+            except Exception as err:
+                _LOGGER.error("Failed to query status: %s", err)
+                raise UpdateFailed(f"Failed to query device status: {err}")
+
+        self._check_push_recovered()
+        data = self._snapshot(STATUS_FIELDS)
+        if data is not self.data:
+            self._save_state()
+        # The device has confirmed the state, even if it matches the saved one
+        self._restored = False
+        return data
+
+    def _snapshot(self, fields: Iterable[str]) -> DeviceState:
+        """Return the published state with fields refreshed from the client.
+
+        Unconfirmed values take precedence. If nothing differs the current
+        snapshot is returned unchanged.
+        """
+        values = self.client.state
+        optimistic = self._optimistic
+        return self.data.update(
+            {
+                field: optimistic[field] if field in optimistic else values.get(field)
+                for field in fields
+            }
+        )
+
+    async def async_send_optimistic(
+        self, field: str, value: Any, command: Awaitable[bool]
+    ) -> bool:
+        """Show the expected value of a field at once, then send the command.
+
+        The value is kept until the device reports the field. If the command
+        fails it is rolled back; if no report arrives within
+        OPTIMISTIC_TIMEOUT only that field is queried.
+        """
+        self._clear_optimistic(field)
+        self._optimistic[field] = value
+        self._optimistic_timers[field] = self.hass.loop.call_later(
+            OPTIMISTIC_TIMEOUT, self._optimistic_expired, field
+        )
+        self._publish({field})
+
+        if await command:
+            return True
+        if self._optimistic.get(field) == value:
+            _LOGGER.debug("Command for %s failed, rolling back", field)
+            self._clear_optimistic(field)
+            self._publish({field})
+        return False
+
+    def _clear_optimistic(self, field: str):
+        """Drop the unconfirmed value of a field."""
+        self._optimistic.pop(field, None)
+        if timer := self._optimistic_timers.pop(field, None):
+            timer.cancel()
+
+    @callback
+    def _optimistic_expired(self, field: str):
+        """Read back a field the device did not confirm in time."""
+        self._optimistic_timers.pop(field, None)
+        self.hass.async_create_task(self._async_confirm_field(field))
+
+    async def _async_confirm_field(self, field: str):
+        """Query a single field and publish whatever the device reports."""
         try:
-            if not await self.client.query_status():
-                raise UpdateFailed("Failed to query device status")
-        except Exception as err:
-            _LOGGER.error("Failed to query status: %s", err)
-            raise UpdateFailed(f"Failed to query device status: {err}")
-        
-        return {
-            "power": self.client.power,
-            "volume": self.client.volume,
-            "muted": self.client.is_muted,
-            "source": self.client.source,
+            await self.client.query(field)
+        except (
+            asyncio.TimeoutError,
+            McIntoshC2800CommandError,
+            ConnectionError,
+        ) as err:
+            _LOGGER.debug("Could not confirm %s: %s", field, err)
+        if field in self._optimistic and field not in self._optimistic_timers:
+            self._optimistic.pop(field)
+            self._publish({field})
+
+    @callback
+    def async_add_field_listener(
+        self, field: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Call update_callback whenever a field or the availability changes."""
+        listeners = self._field_listeners.setdefault(field, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _notify_fields(self, fields: Iterable[str]):
+        """Wake the parameter entities of the given fields."""
+        for field in list(fields):
+            for update_callback in list(self._field_listeners.get(field, ())):
+                update_callback()
+
+    @callback
+    def _publish(self, fields: Iterable[str]):
+        """Publish changed fields to the entities showing them.
+
+        Values identical to the published ones stop here. Coordinator
+        listeners such as the media player are only woken for status
+        fields, so a burst of parameter changes does not rewrite every
+        entity. Power changes wake all parameter entities, which are
+        unavailable while the device is off.
+        """
+        state = self._snapshot(fields)
+        if state is self.data:
+            return
+        if state.changed & STATUS_MASK:
+            self.async_set_updated_data(state)
+        else:
+            self.data = state
+        if state.changed & FIELD_BITS["power"]:
+            self._notify_fields(self._field_listeners)
+        else:
+            self._notify_fields(state.changed_fields)
+
+    def parameter_available(self, field: str) -> bool:
+        """Return True if a parameter entity has a value to show."""
+        if not (self.client.connected or self._restored) or not self.data:
+            return False
+        return bool(self.data.get("power")) and self.data.get(field) is not None
+
+    def supports(self, field: str) -> bool:
+        """Return True unless the detected model lacks the parameter."""
+        return FIELDS[field].supported_by(self.model)
+
+    async def _async_fetch_parameters(self):
+        """Read every parameter of the model once after the device is on.
+
+        Later changes arrive as status pushes, so this is not repeated while
+        the connection and power stay up. Parameters the current
+        configuration does not support are answered with an error and their
+        entities stay unavailable. While the model is unknown, all parameters
+        are read and the model-specific ones answered identify it.
+        """
+        fields = [field for field in PARAMETER_FIELDS if self.supports(field)]
+        replies = await asyncio.gather(
+            *(
+                self.client.request(FIELDS[field].keyword, priority=PRIORITY_POLL)
+                for field in fields
+            ),
+            return_exceptions=True,
+        )
+        unsupported = [
+            field
+            for field, reply in zip(fields, replies)
+            if isinstance(reply, Exception)
+        ]
+        if unsupported:
+            _LOGGER.debug("Parameters not reported: %s", ", ".join(unsupported))
+        if self.model is None:
+            models = {
+                FIELDS[field].model
+                for field, reply in zip(fields, replies)
+                if not isinstance(reply, Exception)
+            } - {None}
+            if len(models) == 1:
+                self._model_detected(models.pop())
+
+    def _model_detected(self, model: str) -> None:
+        """Keep the detected model and drop the other model's entities."""
+        _LOGGER.info("Detected a McIntosh %s", model)
+        self.model = model
+        registry = er.async_get(self.hass)
+        foreign = {
+            f"{self._entry_id}_{field}"
+            for field in PARAMETER_FIELDS
+            if not self.supports(field)
         }
+        for entity in er.async_entries_for_config_entry(registry, self._entry_id):
+            if entity.unique_id in foreign:
+                registry.async_remove(entity.entity_id)
+        if entry := self.hass.config_entries.async_get_entry(self._entry_id):
+            self.hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_MODEL: model}
+            )
+
+    def _handle_status_update(self, changed: frozenset[str] = frozenset()):
+        """Handle a merged status update from the client.
+
+        The client invokes this on the event loop at most once per burst of
+        frames, with the names of the fields that changed.
+        """
+        # A report from the device confirms or overrides unconfirmed values
+        for field in changed & self._optimistic.keys():
+            self._clear_optimistic(field)
 
-    def _handle_status_update(self):
-        """Handle status update from client."""
         if not self.client.connected:
             # Connection lost, schedule reconnection
             _LOGGER.warning("Connection lost, will attempt to reconnect")
+            if unconfirmed := list(self._optimistic):
+                for field in unconfirmed:
+                    self._clear_optimistic(field)
+                self.data = self._snapshot(unconfirmed)
+            if self.client.link_timed_out:
+                self._degrade_push()
+            self._parameters_fetched = False
             # Trigger entity update to reflect unavailable state
-            self.hass.loop.call_soon_threadsafe(self.async_update_listeners)
+            self.async_update_listeners()
+            self._notify_fields(self._field_listeners)
             self._schedule_reconnect()
         else:
-            # Update Home Assistant with new data (this is thread-safe in Home Assistant)
-            self.hass.loop.call_soon_threadsafe(
-                self.async_set_updated_data,
-                {
-                    "power": self.client.power,
-                    "volume": self.client.volume,
-                    "muted": self.client.is_muted,
-                    "source": self.client.source,
-                }
-            )
+            self._check_push_recovered()
+            if changed:
+                self._save_state()
+            if not self.client.power:
+                self._parameters_fetched = False
+            elif not self._parameters_fetched:
+                self._parameters_fetched = True
+                self.hass.async_create_task(self._async_fetch_parameters())
+            self._publish(changed)
+
+    async def async_dump_capture(self) -> str | None:
+        """Write the captured traffic to a file in the config directory.
+
+        Returns the path of the file, or None if capturing is disabled.
+        """
+        capture = self.client.capture
+        if capture is None:
+            return None
+        path = self.hass.config.path(
+            f"{DOMAIN}_capture_{self._entry_id}_{dt_util.now():%Y%m%d_%H%M%S}.txt"
+        )
+        # Format the records now; the read loop keeps appending to the buffer
+        text = "\n".join(capture.lines()) + "\n"
+        await self.hass.async_add_executor_job(Path(path).write_text, text)
+        _LOGGER.info("Wrote %s captured reads and writes to %s", len(capture), path)
+        return path
 
     def _schedule_reconnect(self):
         """Schedule a reconnection attempt."""
@@ -94,31 +462,57 @@ class McIntoshC2800Coordinator(DataUpdateCoordinator):
 
     async def _reconnect_loop(self):
         """Reconnection loop."""
+        attempt = 0
         while self._should_reconnect and not self.client.connected:
-            _LOGGER.info("Attempting to reconnect in %s seconds", RECONNECT_DELAY)
-            await asyncio.sleep(RECONNECT_DELAY)
+            delay = reconnect_delay(attempt, self._reconnect_max_delay)
+            attempt += 1
+            _LOGGER.info("Attempting to reconnect in %.1f seconds", delay)
+            await asyncio.sleep(delay)
             
             try:
                 if await self.client.connect():
                     _LOGGER.info("Reconnected successfully")
-                    # Trigger entity update to reflect available state
-                    self.async_update_listeners()
-                    # Query initial status after reconnection
-                    await self.client.query_status()
+                    # connect() has already queried the status
                     self._handle_status_update()
+                    self._check_push_enabled()
+                    # Publishing marks the data current again, so entities
+                    # a failed refresh left unavailable recover, and starts
+                    # the fallback polling timer if push updates degraded
+                    self.async_set_updated_data(self.data)
+                    self._notify_fields(self._field_listeners)
                     break
             except Exception as err:
                 _LOGGER.error("Reconnection failed: %s", err)
 
-    async def async_shutdown(self):
-        """Shutdown the coordinator."""
+    async def async_shutdown(self, hand_over: bool = False):
+        """Shutdown the coordinator.
+
+        With ``hand_over`` an open connection is parked for the next setup
+        of the entry, such as after a reload, instead of being closed.
+        """
         self._should_reconnect = False
-        
+
+        if self._connect_task:
+            self._connect_task.cancel()
+            try:
+                await self._connect_task
+            except asyncio.CancelledError:
+                pass
+
+        if self.proxy:
+            await self.proxy.async_stop()
+
+        for field in list(self._optimistic):
+            self._clear_optimistic(field)
+
         if self._reconnect_task:
             self._reconnect_task.cancel()
             try:
                 await self._reconnect_task
             except asyncio.CancelledError:
                 pass
-        
-        await self.client.disconnect()
+
+        if hand_over and (streams := await self.client.detach()):
+            async_park(self.hass, self._unique_id, *streams)
+        else:
+            await self.client.disconnect()
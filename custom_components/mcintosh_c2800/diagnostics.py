@@ -0,0 +1,51 @@
+"""Diagnostics support for McIntosh C2800."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import McIntoshC2800Coordinator
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: McIntoshC2800Coordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+    now = time.monotonic()
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "connection": {
+            "connected": client.connected,
+            "link_timed_out": client.link_timed_out,
+            "push_degraded": coordinator.push_degraded,
+            "restored": coordinator.restored,
+            "seconds_since_received": (
+                round(now - client.last_received, 1) if client.last_received else None
+            ),
+            "seconds_since_push": (
+                round(now - client.last_push, 1) if client.last_push else None
+            ),
+            "proxy_clients": coordinator.proxy.client_count if coordinator.proxy else None,
+            "captured_records": len(client.capture) if client.capture else 0,
+        },
+        "data": {
+            "version": coordinator.data.version,
+            "values": dict(coordinator.data.values),
+        },
+        "round_trip": client.rtt.as_dict(),
+        "metrics": client.metrics.as_dict(),
+    }
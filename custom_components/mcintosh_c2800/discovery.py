@@ -0,0 +1,153 @@
+"""Discovery of McIntosh C55/C2800 preamplifiers on the local network."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+from ipaddress import IPv4Address, IPv4Network, ip_network
+import logging
+
+from .codec import COMMANDS
+from .const import (
+    DEFAULT_PORT,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_TIMEOUT,
+    READ_CHUNK_SIZE,
+)
+from .framing import FrameBuffer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DiscoveredDevice:
+    """A host that answered the power query like a preamplifier."""
+
+    host: str
+    port: int
+    power: bool
+
+
+@dataclass(frozen=True)
+class ProbedConnection:
+    """A connection left open after the device answered the probe."""
+
+    device: DiscoveredDevice
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    # Everything read so far, the reply included, for the client to process
+    received: bytes
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.writer.close()
+
+
+def local_network(address: str, prefix: int) -> IPv4Network:
+    """Return the network to scan around an interface address.
+
+    Networks larger than DISCOVERY_MAX_HOSTS are narrowed to the /24 the
+    address belongs to.
+    """
+    network = ip_network(f"{address}/{prefix}", strict=False)
+    if network.num_addresses > DISCOVERY_MAX_HOSTS:
+        network = ip_network(f"{address}/24", strict=False)
+    return network
+
+
+async def async_probe(
+    host: str, port: int = DEFAULT_PORT, timeout: float = DISCOVERY_TIMEOUT
+) -> DiscoveredDevice | None:
+    """Return the device at host if it answers a power query within timeout."""
+    try:
+        connection = await async_open_probe(host, port, timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    if connection is None:
+        return None
+    connection.close()
+    try:
+        await connection.writer.wait_closed()
+    except OSError:
+        pass
+    return connection.device
+
+
+async def async_open_probe(
+    host: str, port: int = DEFAULT_PORT, timeout: float = DISCOVERY_TIMEOUT
+) -> ProbedConnection | None:
+    """Connect, make one power query round trip and keep the connection open.
+
+    Returns None if the host answers with something other than a power
+    report, and raises OSError or asyncio.TimeoutError if it cannot be
+    reached or does not answer within timeout.
+    """
+    return await asyncio.wait_for(_probe(host, port), timeout)
+
+
+async def _probe(host: str, port: int) -> ProbedConnection | None:
+    """Send one power query and wait for its reply."""
+    reader, writer = await asyncio.open_connection(host, port)
+    connection = None
+    try:
+        writer.write(b"(PWR)\r\n")
+        await writer.drain()
+        frames = FrameBuffer()
+        received = bytearray()
+        # The device may push status frames ahead of the reply
+        while data := await reader.read(READ_CHUNK_SIZE):
+            received += data
+            for frame in frames.feed(data):
+                parts = frame.decode("ascii", errors="ignore").split()
+                if len(parts) != 2 or parts[0].upper() != "PWR":
+                    continue
+                try:
+                    power = COMMANDS["PWR"].decode(parts[1])
+                except ValueError:
+                    return None
+                connection = ProbedConnection(
+                    DiscoveredDevice(host, port, power), reader, writer, bytes(received)
+                )
+                return connection
+        return None
+    finally:
+        # Also closes when cancelled by the timeout
+        if connection is None:
+            writer.close()
+
+
+async def async_scan(
+    networks: Iterable[IPv4Network],
+    port: int = DEFAULT_PORT,
+    timeout: float = DISCOVERY_TIMEOUT,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+    exclude: Iterable[str] = (),
+) -> list[DiscoveredDevice]:
+    """Probe every host of the networks concurrently and return the devices.
+
+    At most ``concurrency`` connection attempts are open at a time and each
+    host gets ``timeout`` seconds, so hosts that never answer cost one
+    timeout per batch rather than one each. Hosts in ``exclude`` (such as
+    devices already configured, whose single control connection is in use)
+    are skipped.
+    """
+    skipped = set(exclude)
+    hosts: dict[IPv4Address, None] = {}
+    for network in networks:
+        if network.num_addresses > DISCOVERY_MAX_HOSTS:
+            raise ValueError(f"{network} has more than {DISCOVERY_MAX_HOSTS} addresses")
+        hosts.update(
+            dict.fromkeys(host for host in network.hosts() if str(host) not in skipped)
+        )
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def probe(host: IPv4Address) -> DiscoveredDevice | None:
+        async with semaphore:
+            return await async_probe(str(host), port, timeout)
+
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    devices = [device for device in results if device is not None]
+    _LOGGER.debug("Scanned %s hosts, found %s", len(hosts), devices)
+    return devices
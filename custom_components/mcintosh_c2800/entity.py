@@ -0,0 +1,67 @@
+"""Base entity for McIntosh C2800 parameters."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.helpers.entity import Entity, EntityDescription
+
+from .codec import FIELDS, CommandSpec
+from .coordinator import McIntoshC2800Coordinator
+
+
+class McIntoshC2800ParameterEntity(Entity):
+    """Entity showing one device parameter.
+
+    Unlike the media player these entities do not listen to every
+    coordinator update: each subscribes to its own field and writes its
+    state only when that field, the power state or the connection changes.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        coordinator: McIntoshC2800Coordinator,
+        entry: ConfigEntry,
+        description: EntityDescription,
+    ) -> None:
+        """Initialize the entity."""
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_name = f"McIntosh C2800 ({entry.data[CONF_HOST]}) {description.name}"
+
+    @property
+    def spec(self) -> CommandSpec:
+        """Return the protocol command of this parameter."""
+        return FIELDS[self.entity_description.key]
+
+    @property
+    def parameter_value(self) -> Any:
+        """Return the current value of the parameter."""
+        if self.coordinator.data:
+            return self.coordinator.data.get(self.entity_description.key)
+        return None
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.parameter_available(self.entity_description.key)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to changes of this parameter."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_field_listener(
+                self.entity_description.key, self.async_write_ha_state
+            )
+        )
+
+    async def async_send_value(self, value: Any) -> None:
+        """Set the parameter, showing the new value until the device reports."""
+        field = self.entity_description.key
+        await self.coordinator.async_send_optimistic(
+            field, value, self.coordinator.client.set_value(field, value)
+        )
@@ -0,0 +1,100 @@
+"""Frame extraction for the McIntosh C2800 byte stream."""
+from __future__ import annotations
+
+import logging
+
+from .const import MAX_FRAME_LENGTH
+
+_LOGGER = logging.getLogger(__name__)
+
+FRAME_START = 0x28  # "("
+FRAME_END = 0x29  # ")"
+
+
+class FrameBuffer:
+    """Incremental parser for parenthesis-delimited frames.
+
+    Bytes are appended to a single ``bytearray`` and scanned from where the
+    previous call stopped, so every byte is inspected once no matter how a
+    frame is split across reads. Bytes outside a frame are skipped, an
+    unexpected ``(`` inside an open frame re-synchronises on the new start
+    byte, and a frame that grows past ``max_frame_length`` without being
+    closed is discarded on its own, leaving the rest of the stream intact.
+    """
+
+    def __init__(self, max_frame_length: int = MAX_FRAME_LENGTH) -> None:
+        """Initialize the frame buffer."""
+        self._buffer = bytearray()
+        self._max_frame_length = max_frame_length
+        # Offset of the "(" of the frame being assembled, or -1 between frames
+        self._start = -1
+        # Offset up to which the buffer has already been scanned
+        self._scan = 0
+        self.dropped_bytes = 0
+        self.overflows = 0
+
+    def __len__(self) -> int:
+        """Return the number of buffered bytes not yet consumed."""
+        return len(self._buffer)
+
+    def reset(self) -> None:
+        """Discard any partially received frame."""
+        self._buffer.clear()
+        self._start = -1
+        self._scan = 0
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Append received bytes and return the payloads of complete frames."""
+        buffer = self._buffer
+        buffer += data
+        size = len(buffer)
+        frames: list[bytes] = []
+        start = self._start
+        pos = self._scan
+
+        while pos < size:
+            if start == -1:
+                start = buffer.find(FRAME_START, pos)
+                if start == -1:
+                    # Nothing but noise until the end of the buffer
+                    self.dropped_bytes += size - pos
+                    pos = size
+                    break
+                self.dropped_bytes += start - pos
+                pos = start + 1
+
+            end = buffer.find(FRAME_END, pos)
+            limit = size if end == -1 else end
+            restart = buffer.rfind(FRAME_START, pos, limit)
+            if restart != -1:
+                # Unbalanced "(": resync on the innermost start byte
+                self.dropped_bytes += restart - start
+                start = restart
+                pos = restart + 1
+
+            if end == -1:
+                if size - start > self._max_frame_length:
+                    _LOGGER.warning(
+                        "Discarding unterminated frame of %s bytes", size - start
+                    )
+                    self.overflows += 1
+                    self.dropped_bytes += size - start
+                    start = -1
+                pos = size
+                break
+
+            frames.append(bytes(buffer[start + 1 : end]))
+            start = -1
+            pos = end + 1
+
+        # Compact consumed bytes; deleting from the front of a bytearray is
+        # amortised O(1) in CPython, so this never copies the whole buffer.
+        consumed = pos if start == -1 else start
+        if consumed:
+            del buffer[:consumed]
+            pos -= consumed
+            if start != -1:
+                start -= consumed
+        self._start = start
+        self._scan = pos
+        return frames
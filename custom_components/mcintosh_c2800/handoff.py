@@ -0,0 +1,90 @@
+"""Open connections waiting to be adopted by the next setup of an entry.
+
+Some preamplifiers accept a single control session. Closing the connection
+the config flow validated, or the one an entry used before a reload, and
+opening a new one moments later doubles the handshakes and queries and can
+be refused while the device still holds the old session. Such a connection
+is parked here under the entry's unique ID instead, and the coordinator
+adopts it when the entry is set up. Connections nobody claims within
+HANDOFF_TIMEOUT seconds are closed.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, HANDOFF_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HANDOFF = f"{DOMAIN}_handoff"
+
+
+@dataclass
+class ParkedConnection:
+    """A connection to a device with the bytes already read from it."""
+
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    received: bytes
+    cancel_expiry: CALLBACK_TYPE | None = None
+
+
+@callback
+def async_park(
+    hass: HomeAssistant,
+    unique_id: str,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    received: bytes = b"",
+) -> None:
+    """Keep a connection open for the next setup of the entry."""
+    parked: dict[str, ParkedConnection] = hass.data.setdefault(DATA_HANDOFF, {})
+    if previous := parked.pop(unique_id, None):
+        _close(previous)
+    connection = ParkedConnection(reader, writer, received)
+
+    @callback
+    def expire(_now) -> None:
+        if parked.get(unique_id) is connection:
+            _LOGGER.debug("Closing unclaimed connection to %s", unique_id)
+            del parked[unique_id]
+            connection.cancel_expiry = None
+            _close(connection)
+
+    connection.cancel_expiry = async_call_later(hass, HANDOFF_TIMEOUT, expire)
+    parked[unique_id] = connection
+
+
+@callback
+def async_claim(hass: HomeAssistant, unique_id: str) -> ParkedConnection | None:
+    """Return the connection parked for an entry, if it is still open."""
+    connection = hass.data.get(DATA_HANDOFF, {}).pop(unique_id, None)
+    if connection is None:
+        return None
+    if connection.cancel_expiry:
+        connection.cancel_expiry()
+        connection.cancel_expiry = None
+    if connection.writer.transport.is_closing() or connection.reader.at_eof():
+        connection.writer.close()
+        return None
+    return connection
+
+
+@callback
+def async_discard(hass: HomeAssistant, unique_id: str) -> None:
+    """Close the connection parked for an entry, if any."""
+    if connection := async_claim(hass, unique_id):
+        connection.writer.close()
+
+
+def _close(connection: ParkedConnection) -> None:
+    """Close a parked connection and stop its expiry timer."""
+    if connection.cancel_expiry:
+        connection.cancel_expiry()
+        connection.cancel_expiry = None
+    connection.writer.close()
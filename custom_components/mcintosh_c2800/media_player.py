@@ -2,8 +2,14 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
+
+import voluptuous as vol
 
 from homeassistant.components.media_player import (
+    ATTR_INPUT_SOURCE,
+    ATTR_MEDIA_VOLUME_LEVEL,
+    ATTR_MEDIA_VOLUME_MUTED,
     MediaPlayerDeviceClass,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
@@ -11,11 +17,23 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, INPUT_SOURCES, INPUT_SOURCE_MAP, INPUT_SOURCE_REVERSE_MAP
+from .const import (
+    ATTR_DURATION,
+    ATTR_POWER,
+    DOMAIN,
+    INPUT_SOURCES,
+    INPUT_SOURCE_MAP,
+    INPUT_SOURCE_REVERSE_MAP,
+    MAX_RAMP_DURATION,
+    SERVICE_APPLY_STATE,
+    SERVICE_DUMP_CAPTURE,
+    SERVICE_VOLUME_RAMP,
+)
 from .coordinator import McIntoshC2800Coordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,6 +48,29 @@ async def async_setup_entry(
     coordinator: McIntoshC2800Coordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities([McIntoshC2800MediaPlayer(coordinator, entry)])
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_VOLUME_RAMP,
+        {
+            vol.Required(ATTR_MEDIA_VOLUME_LEVEL): cv.small_float,
+            vol.Required(ATTR_DURATION): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=MAX_RAMP_DURATION)
+            ),
+        },
+        "async_volume_ramp",
+    )
+    platform.async_register_entity_service(
+        SERVICE_APPLY_STATE,
+        {
+            vol.Optional(ATTR_POWER): cv.boolean,
+            vol.Optional(ATTR_INPUT_SOURCE): vol.In(INPUT_SOURCES),
+            vol.Optional(ATTR_MEDIA_VOLUME_LEVEL): cv.small_float,
+            vol.Optional(ATTR_MEDIA_VOLUME_MUTED): cv.boolean,
+        },
+        "async_apply_state",
+    )
+    platform.async_register_entity_service(SERVICE_DUMP_CAPTURE, {}, "async_dump_capture")
+
 
 class McIntoshC2800MediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     """Representation of a McIntosh C2800 media player."""
@@ -54,16 +95,34 @@ class McIntoshC2800MediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         self._attr_unique_id = f"{entry.entry_id}_media_player"
         self._attr_name = f"McIntosh C2800 ({entry.data[CONF_HOST]})"
         self._attr_source_list = INPUT_SOURCES
+        # Snapshot version and availability last written to the state machine
+        self._written: tuple[int, bool, bool] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the snapshot or the availability changed."""
+        written = (self.coordinator.data.version, self.available, self.coordinator.restored)
+        if written == self._written:
+            return
+        self._written = written
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.client.connected
+        return self.coordinator.client.connected or self.coordinator.restored
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag state restored from the last run until the device reports."""
+        if self.coordinator.restored:
+            return {"restored": True}
+        return None
 
     @property
     def state(self) -> MediaPlayerState:
         """Return the state of the device."""
-        if not self.coordinator.client.connected:
+        if not self.coordinator.client.connected and not self.coordinator.restored:
             return MediaPlayerState.OFF
 
         if self.coordinator.data and self.coordinator.data.get("power"):
@@ -98,43 +157,83 @@ class McIntoshC2800MediaPlayer(CoordinatorEntity, MediaPlayerEntity):
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
-        if await self.coordinator.client.power_on():
-            await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_optimistic(
+            "power", True, self.coordinator.client.power_on()
+        )
 
     async def async_turn_off(self) -> None:
         """Turn the media player off."""
-        if await self.coordinator.client.power_off():
-            await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_optimistic(
+            "power", False, self.coordinator.client.power_off()
+        )
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
         volume_percent = int(volume * 100)
-        if await self.coordinator.client.set_volume(volume_percent):
-            await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_optimistic(
+            "volume", volume_percent, self.coordinator.client.set_volume(volume_percent)
+        )
+
+    async def async_volume_ramp(self, volume_level: float, duration: float) -> None:
+        """Fade the volume to a level (0..1) over a duration in seconds.
+
+        The fade runs in the client, which paces the steps by the device's
+        echoes; any other volume command stops it.
+        """
+        await self.coordinator.client.ramp_volume(round(volume_level * 100), duration)
+
+    async def async_apply_state(
+        self,
+        power: bool | None = None,
+        source: str | None = None,
+        volume_level: float | None = None,
+        is_volume_muted: bool | None = None,
+    ) -> None:
+        """Apply power, source, volume and mute in one batch.
+
+        Returns once the device has acknowledged every value, so a scene
+        needs no delays between its steps.
+        """
+        await self.coordinator.client.apply_state(
+            power=power,
+            source=INPUT_SOURCE_MAP[source] if source is not None else None,
+            volume=round(volume_level * 100) if volume_level is not None else None,
+            muted=is_volume_muted,
+        )
+
+    async def async_dump_capture(self) -> None:
+        """Write the recent traffic with the device to a capture file."""
+        if await self.coordinator.async_dump_capture() is None:
+            _LOGGER.warning("Traffic capture is disabled")
 
     async def async_volume_up(self) -> None:
         """Volume up the media player."""
-        if await self.coordinator.client.volume_up():
-            await self.coordinator.async_request_refresh()
+        volume = self.coordinator.data.get("volume", 0)
+        await self.coordinator.async_send_optimistic(
+            "volume", min(volume + 1, 100), self.coordinator.client.volume_up()
+        )
 
     async def async_volume_down(self) -> None:
         """Volume down the media player."""
-        if await self.coordinator.client.volume_down():
-            await self.coordinator.async_request_refresh()
+        volume = self.coordinator.data.get("volume", 0)
+        await self.coordinator.async_send_optimistic(
+            "volume", max(volume - 1, 0), self.coordinator.client.volume_down()
+        )
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute the volume."""
-        success = False
         if mute:
-            success = await self.coordinator.client.mute_on()
+            command = self.coordinator.client.mute_on()
         else:
-            success = await self.coordinator.client.mute_off()
-        if success:
-            await self.coordinator.async_request_refresh()
+            command = self.coordinator.client.mute_off()
+        await self.coordinator.async_send_optimistic("muted", mute, command)
 
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
         # Convert display name to protocol command number
         protocol_command = INPUT_SOURCE_MAP.get(source, source)
-        if await self.coordinator.client.select_source(protocol_command):
-            await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_optimistic(
+            "source",
+            protocol_command,
+            self.coordinator.client.select_source(protocol_command),
+        )
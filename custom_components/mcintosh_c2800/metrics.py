@@ -0,0 +1,132 @@
+"""Protocol performance counters for the McIntosh C2800 client."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+# Upper bounds of the round-trip latency buckets, in milliseconds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of round-trip times."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        # One extra bucket for samples above the last bound
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        """Add a sample."""
+        index = 0
+        for bound in LATENCY_BUCKETS_MS:
+            if latency_ms <= bound:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    @property
+    def mean_ms(self) -> float | None:
+        """Return the mean latency."""
+        return self.total_ms / self.count if self.count else None
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket bound below which ``fraction`` of samples fall."""
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= target:
+                return float(bound)
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        buckets = {f"le_{bound}ms": count for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)}
+        buckets["gt_5000ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": None if self.mean_ms is None else round(self.mean_ms, 2),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 2),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class ClientMetrics:
+    """Counters describing the traffic and health of one device connection."""
+
+    bytes_in: int = 0
+    bytes_out: int = 0
+    frames_in: int = 0
+    frames_out: int = 0
+    parse_errors: int = 0
+    device_errors: int = 0
+    request_timeouts: int = 0
+    deadline_misses: int = 0  # writes and requests that ran out of time
+    deadline_reconnects: int = 0  # connections dropped after repeated misses
+    dropped_bytes: int = 0
+    buffer_overflows: int = 0
+    connects: int = 0
+    reconnects: int = 0
+    downtime: float = 0.0  # seconds spent disconnected between connections
+    status_callbacks: int = 0
+    status_fields: int = 0  # fields delivered across all status callbacks
+    coalesced_frames: int = 0
+    superseded_commands: int = 0
+    unchanged_reports: int = 0  # frames repeating the value already known
+    deduplicated_queries: int = 0
+    held_commands: int = 0  # commands delayed until the device finished powering up
+    expired_commands: int = 0  # held commands dropped because power-up never completed
+    latency: dict[str, LatencyHistogram] = field(default_factory=dict)
+    # Time commands spent queued before being written, per priority class
+    queue_wait: dict[str, LatencyHistogram] = field(default_factory=dict)
+    # Time from calling a write or request to its completion, per priority class
+    operation_latency: dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    def record_latency(self, keyword: str, latency_ms: float) -> None:
+        """Record the round-trip time of a command."""
+        if (histogram := self.latency.get(keyword)) is None:
+            histogram = self.latency[keyword] = LatencyHistogram()
+        histogram.record(latency_ms)
+
+    def record_queue_wait(self, priority: str, wait_ms: float) -> None:
+        """Record how long a write waited in the send queue."""
+        if (histogram := self.queue_wait.get(priority)) is None:
+            histogram = self.queue_wait[priority] = LatencyHistogram()
+        histogram.record(wait_ms)
+
+    def record_operation(self, priority: str, latency_ms: float) -> None:
+        """Record how long a write or request took to complete."""
+        if (histogram := self.operation_latency.get(priority)) is None:
+            histogram = self.operation_latency[priority] = LatencyHistogram()
+        histogram.record(latency_ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all counters for diagnostics."""
+        data = asdict(self)
+        data["downtime"] = round(self.downtime, 3)
+        data["latency"] = {
+            keyword: histogram.as_dict() for keyword, histogram in self.latency.items()
+        }
+        data["queue_wait"] = {
+            priority: histogram.as_dict()
+            for priority, histogram in self.queue_wait.items()
+        }
+        data["operation_latency"] = {
+            priority: histogram.as_dict()
+            for priority, histogram in self.operation_latency.items()
+        }
+        return data
@@ -0,0 +1,85 @@
+"""Level controls for McIntosh C2800 parameters."""
+from __future__ import annotations
+
+from homeassistant.components.number import NumberEntity, NumberEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import McIntoshC2800Coordinator
+from .entity import McIntoshC2800ParameterEntity
+
+DECIBEL = "dB"
+
+NUMBERS: tuple[NumberEntityDescription, ...] = (
+    NumberEntityDescription(
+        key="balance",
+        name="Balance",
+        native_unit_of_measurement=DECIBEL,
+        icon="mdi:scale-balance",
+    ),
+    NumberEntityDescription(
+        key="input_trim",
+        name="Input trim",
+        native_unit_of_measurement=DECIBEL,
+        entity_category=EntityCategory.CONFIG,
+    ),
+    NumberEntityDescription(
+        key="output_1_trim",
+        name="Output 1 trim",
+        native_unit_of_measurement=DECIBEL,
+        entity_category=EntityCategory.CONFIG,
+    ),
+    NumberEntityDescription(
+        key="bass",
+        name="Bass",
+        native_unit_of_measurement=DECIBEL,
+    ),
+    NumberEntityDescription(
+        key="treble",
+        name="Treble",
+        native_unit_of_measurement=DECIBEL,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the McIntosh C2800 level controls."""
+    coordinator: McIntoshC2800Coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        McIntoshC2800Number(coordinator, entry, description)
+        for description in NUMBERS
+        if coordinator.supports(description.key)
+    )
+
+
+class McIntoshC2800Number(McIntoshC2800ParameterEntity, NumberEntity):
+    """Level parameter with the range and step of its protocol command."""
+
+    def __init__(
+        self,
+        coordinator: McIntoshC2800Coordinator,
+        entry: ConfigEntry,
+        description: NumberEntityDescription,
+    ) -> None:
+        """Initialize the number."""
+        super().__init__(coordinator, entry, description)
+        spec = self.spec
+        self._attr_native_min_value = spec.minimum * spec.scale
+        self._attr_native_max_value = spec.maximum * spec.scale
+        self._attr_native_step = spec.scale
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the current level."""
+        return self.parameter_value
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set a new level."""
+        await self.async_send_value(value)
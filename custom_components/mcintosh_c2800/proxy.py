@@ -0,0 +1,98 @@
+"""Control-port proxy sharing the device connection with other controllers."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from .client import McIntoshC2800Client
+from .const import PROXY_MAX_WRITE_BUFFER, READ_CHUNK_SIZE
+from .framing import FrameBuffer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class McIntoshC2800Proxy:
+    """Local TCP server multiplexing controllers onto one device connection.
+
+    The preamplifier accepts a single control session, so other control
+    systems connect here instead. Every frame received from the device is
+    sent to all of them, and their commands are written through the
+    client's own write path, which serializes them with Home Assistant's.
+    Each command takes a reply slot in write order there, so the device's
+    answer to it, an error included, is never taken for the reply to one
+    of Home Assistant's requests, nor the other way round.
+    """
+
+    def __init__(self, client: McIntoshC2800Client, port: int, host: str = "0.0.0.0"):
+        """Initialize the proxy."""
+        self._client = client
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._unsub_frames = None
+
+    @property
+    def client_count(self) -> int:
+        """Return the number of connected downstream controllers."""
+        return len(self._writers)
+
+    async def async_start(self) -> bool:
+        """Start accepting downstream connections."""
+        try:
+            self._server = await asyncio.start_server(
+                self._handle_connection, self.host, self.port
+            )
+        except OSError as err:
+            _LOGGER.error("Cannot start control proxy on port %s: %s", self.port, err)
+            return False
+        self._unsub_frames = self._client.add_frame_listener(self._forward_frame)
+        _LOGGER.info("Control proxy for %s listening on port %s", self._client.host, self.port)
+        return True
+
+    async def async_stop(self):
+        """Stop the server and close downstream connections."""
+        if self._unsub_frames:
+            self._unsub_frames()
+            self._unsub_frames = None
+        if self._server:
+            self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        self._writers.clear()
+        if self._server:
+            await self._server.wait_closed()
+            self._server = None
+
+    def _forward_frame(self, message: str):
+        """Send a frame received from the device to every controller."""
+        payload = f"({message})\r\n".encode("ascii", errors="ignore")
+        for writer in list(self._writers):
+            if writer.transport.get_write_buffer_size() > PROXY_MAX_WRITE_BUFFER:
+                # A controller that stops reading must not hold frames forever
+                _LOGGER.warning("Dropping control proxy client that stopped reading")
+                self._writers.discard(writer)
+                writer.close()
+                continue
+            writer.write(payload)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """Relay commands from one downstream controller."""
+        peer = writer.get_extra_info("peername")
+        _LOGGER.debug("Control proxy client connected: %s", peer)
+        self._writers.add(writer)
+        frames = FrameBuffer()
+        try:
+            while data := await reader.read(READ_CHUNK_SIZE):
+                for frame in frames.feed(data):
+                    if command := frame.decode("ascii", errors="ignore").strip():
+                        # Not awaited: the reply reaches every controller
+                        await self._client.send_command(command)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            _LOGGER.debug("Control proxy client disconnected: %s", peer)
+            self._writers.discard(writer)
+            writer.close()
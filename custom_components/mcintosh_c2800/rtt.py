@@ -0,0 +1,67 @@
+"""Round-trip time estimate of a device and the timeout derived from it.
+
+Follows the retransmission timer of TCP (RFC 6298): a smoothed round-trip
+time and its mean deviation are updated from every matched query reply,
+and the timeout is the smoothed time plus four deviations, kept between
+configurable limits. A lost reply doubles the timeout until the next
+sample. Until the first sample the upper limit is used.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+RTT_ALPHA = 1 / 8  # weight of a new sample in the smoothed round-trip time
+RTT_BETA = 1 / 4  # weight of a new sample in the round-trip deviation
+RTT_K = 4  # deviations added to the smoothed round-trip time
+
+
+class RttEstimator:
+    """Smoothed round-trip time and timeout of one device."""
+
+    __slots__ = ("min_timeout", "max_timeout", "srtt", "rttvar", "samples", "_timeout")
+
+    def __init__(self, min_timeout: float, max_timeout: float) -> None:
+        """Initialize the estimate; timeouts are kept within the limits."""
+        self.max_timeout = max_timeout
+        self.min_timeout = min(min_timeout, max_timeout)
+        self.srtt: float | None = None
+        self.rttvar: float | None = None
+        self.samples = 0
+        self._timeout = max_timeout
+
+    @property
+    def timeout(self) -> float:
+        """Return the seconds to wait for a reply."""
+        return self._timeout
+
+    def sample(self, rtt: float) -> None:
+        """Add the round-trip time of a reply, in seconds."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+        self.samples += 1
+        self._timeout = min(
+            max(self.srtt + RTT_K * self.rttvar, self.min_timeout), self.max_timeout
+        )
+
+    def backoff(self) -> None:
+        """Double the timeout after a reply was not received in time."""
+        self._timeout = min(self._timeout * 2, self.max_timeout)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimate in milliseconds for diagnostics."""
+
+        def ms(seconds: float | None) -> float | None:
+            return None if seconds is None else round(seconds * 1000, 2)
+
+        return {
+            "samples": self.samples,
+            "srtt_ms": ms(self.srtt),
+            "rttvar_ms": ms(self.rttvar),
+            "timeout_ms": ms(self._timeout),
+            "min_timeout_ms": ms(self.min_timeout),
+            "max_timeout_ms": ms(self.max_timeout),
+        }
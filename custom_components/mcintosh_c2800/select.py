@@ -0,0 +1,93 @@
+"""Choice controls for McIntosh C2800 parameters."""
+from __future__ import annotations
+
+from homeassistant.components.select import SelectEntity, SelectEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import McIntoshC2800Coordinator
+from .entity import McIntoshC2800ParameterEntity
+
+SELECTS: tuple[SelectEntityDescription, ...] = (
+    SelectEntityDescription(
+        key="display_brightness",
+        name="Display brightness",
+        icon="mdi:brightness-6",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    SelectEntityDescription(
+        key="phono_capacitance",
+        name="Phono capacitance",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    SelectEntityDescription(
+        key="phono_resistance",
+        name="Phono resistance",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    SelectEntityDescription(
+        key="phono_gain",
+        name="Phono gain",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    SelectEntityDescription(
+        key="output_1_mode",
+        name="Output 1 mode",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    SelectEntityDescription(
+        key="crossover_frequency",
+        name="Crossover frequency",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    SelectEntityDescription(
+        key="high_pass",
+        name="High pass",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    SelectEntityDescription(
+        key="low_pass",
+        name="Low pass",
+        entity_category=EntityCategory.CONFIG,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the McIntosh C2800 choice controls."""
+    coordinator: McIntoshC2800Coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        McIntoshC2800Select(coordinator, entry, description)
+        for description in SELECTS
+        if coordinator.supports(description.key)
+    )
+
+
+class McIntoshC2800Select(McIntoshC2800ParameterEntity, SelectEntity):
+    """Indexed parameter offering the labels of its protocol values."""
+
+    def __init__(
+        self,
+        coordinator: McIntoshC2800Coordinator,
+        entry: ConfigEntry,
+        description: SelectEntityDescription,
+    ) -> None:
+        """Initialize the select."""
+        super().__init__(coordinator, entry, description)
+        self._attr_options = list(self.spec.options.values())
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the selected option."""
+        return self.parameter_value
+
+    async def async_select_option(self, option: str) -> None:
+        """Select an option."""
+        await self.async_send_value(option)
@@ -0,0 +1,165 @@
+"""Sensors for McIntosh C2800."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .codec import FIELDS
+from .const import DOMAIN
+from .coordinator import McIntoshC2800Coordinator
+from .entity import McIntoshC2800ParameterEntity
+from .metrics import ClientMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _mean_latency(metrics: ClientMetrics) -> float | None:
+    """Return the mean round-trip time across all commands."""
+    count = sum(histogram.count for histogram in metrics.latency.values())
+    if not count:
+        return None
+    total = sum(histogram.total_ms for histogram in metrics.latency.values())
+    return round(total / count, 1)
+
+
+DIAGNOSTIC_SENSORS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="command_latency",
+        name="Command latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="bytes_in",
+        name="Bytes received",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="frames_in",
+        name="Frames received",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="parse_errors",
+        name="Parse errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="dropped_bytes",
+        name="Dropped bytes",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="reconnects",
+        name="Reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="downtime",
+        name="Downtime",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="status_callbacks",
+        name="Status updates",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+)
+
+# Read-only device parameters
+PARAMETER_SENSORS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="headphones",
+        name="Headphones",
+        icon="mdi:headphones",
+        device_class=SensorDeviceClass.ENUM,
+        options=list(FIELDS["headphones"].options.values()),
+    ),
+    SensorEntityDescription(
+        key="audio_format",
+        name="Audio format",
+        icon="mdi:waveform",
+    ),
+)
+
+VALUE_FUNCTIONS: dict[str, Callable[[ClientMetrics], float | int | None]] = {
+    "command_latency": _mean_latency,
+    "bytes_in": lambda metrics: metrics.bytes_in,
+    "frames_in": lambda metrics: metrics.frames_in,
+    "parse_errors": lambda metrics: metrics.parse_errors,
+    "dropped_bytes": lambda metrics: metrics.dropped_bytes,
+    "reconnects": lambda metrics: metrics.reconnects,
+    "downtime": lambda metrics: round(metrics.downtime, 1),
+    "status_callbacks": lambda metrics: metrics.status_callbacks,
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the McIntosh C2800 sensors."""
+    coordinator: McIntoshC2800Coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        McIntoshC2800DiagnosticSensor(coordinator, entry, description)
+        for description in DIAGNOSTIC_SENSORS
+    )
+    async_add_entities(
+        McIntoshC2800ParameterSensor(coordinator, entry, description)
+        for description in PARAMETER_SENSORS
+        if coordinator.supports(description.key)
+    )
+
+
+class McIntoshC2800ParameterSensor(McIntoshC2800ParameterEntity, SensorEntity):
+    """Read-only device parameter."""
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the reported value."""
+        return self.parameter_value
+
+
+class McIntoshC2800DiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """Connection metric exposed as a sensor, disabled by default."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: McIntoshC2800Coordinator,
+        entry: ConfigEntry,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_name = f"McIntosh C2800 ({entry.data[CONF_HOST]}) {description.name}"
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current metric value."""
+        return VALUE_FUNCTIONS[self.entity_description.key](self.coordinator.client.metrics)
@@ -0,0 +1,66 @@
+"""Immutable, versioned snapshots of the device state."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from .codec import COMMAND_SPECS
+
+# One bit per field of the command table, for cheap change masks
+FIELD_BITS: dict[str, int] = {
+    spec.field: 1 << index for index, spec in enumerate(COMMAND_SPECS)
+}
+
+_MISSING = object()
+
+
+def field_mask(fields: Iterable[str]) -> int:
+    """Return the change mask covering the given fields."""
+    mask = 0
+    for name in fields:
+        mask |= FIELD_BITS[name]
+    return mask
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceState:
+    """Snapshot of the device state as published to entities.
+
+    Snapshots are never modified: an update that changes at least one value
+    produces a new snapshot with the next version and a mask of the fields
+    that differ from the previous one, while an update that changes nothing
+    returns the same snapshot so callers can stop there.
+    """
+
+    values: Mapping[str, Any] = field(default_factory=dict)
+    version: int = 0
+    changed: int = 0
+
+    def __bool__(self) -> bool:
+        """Return True once any value is known."""
+        return bool(self.values)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return the value of a field."""
+        return self.values.get(name, default)
+
+    def has_changed(self, name: str) -> bool:
+        """Return True if a field changed in the update that made this snapshot."""
+        return bool(self.changed & FIELD_BITS[name])
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """Return the fields that changed in the update that made this snapshot."""
+        return frozenset(name for name, bit in FIELD_BITS.items() if self.changed & bit)
+
+    def update(self, values: Mapping[str, Any]) -> DeviceState:
+        """Return the snapshot with values applied, or self if none differ."""
+        current = self.values
+        changed = 0
+        for name, value in values.items():
+            if current.get(name, _MISSING) != value:
+                changed |= FIELD_BITS[name]
+        if not changed:
+            return self
+        return DeviceState({**current, **values}, self.version + 1, changed)
@@ -0,0 +1,76 @@
+"""On/off controls for McIntosh C2800 parameters."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import McIntoshC2800Coordinator
+from .entity import McIntoshC2800ParameterEntity
+
+SWITCHES: tuple[SwitchEntityDescription, ...] = (
+    SwitchEntityDescription(key="output_1", name="Output 1"),
+    SwitchEntityDescription(key="output_2", name="Output 2"),
+    SwitchEntityDescription(key="mono", name="Mono"),
+    SwitchEntityDescription(key="tone_control", name="Tone control"),
+    SwitchEntityDescription(key="equalizer", name="Equalizer"),
+    SwitchEntityDescription(key="hxd", name="HXD"),
+    SwitchEntityDescription(
+        key="processor_loop",
+        name="Processor loop",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    SwitchEntityDescription(
+        key="dual_mono",
+        name="Output 2 dual mono",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    SwitchEntityDescription(
+        key="meter_lights",
+        name="Meter lights",
+        icon="mdi:lightbulb",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    SwitchEntityDescription(
+        key="tube_lights",
+        name="Tube lights",
+        icon="mdi:lightbulb",
+        entity_category=EntityCategory.CONFIG,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the McIntosh C2800 on/off controls."""
+    coordinator: McIntoshC2800Coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        McIntoshC2800Switch(coordinator, entry, description)
+        for description in SWITCHES
+        if coordinator.supports(description.key)
+    )
+
+
+class McIntoshC2800Switch(McIntoshC2800ParameterEntity, SwitchEntity):
+    """On/off parameter."""
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if the parameter is on."""
+        return self.parameter_value
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the parameter on."""
+        await self.async_send_value(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the parameter off."""
+        await self.async_send_value(False)
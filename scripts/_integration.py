@@ -0,0 +1,24 @@
+"""Import the integration's protocol modules without Home Assistant.
+
+The package ``__init__`` pulls in Home Assistant, but the client, framing and
+related modules only depend on the standard library. Registering a bare
+package object lets the scripts import those modules directly.
+"""
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+import sys
+import types
+
+PACKAGE = "mcintosh_c2800"
+PACKAGE_PATH = Path(__file__).resolve().parent.parent / "custom_components" / PACKAGE
+
+
+def load(module: str) -> types.ModuleType:
+    """Import a module of the integration package, e.g. ``load("client")``."""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(PACKAGE_PATH)]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{module}")
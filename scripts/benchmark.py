@@ -0,0 +1,254 @@
+"""Microbenchmarks for the client's protocol hot paths.
+
+Measures the per-frame cost of framing received bytes, decoding frames with
+``_parse_response`` and the full receive path, plus the per-command cost of
+queueing, encoding and writing through ``_send_command``. Inputs cover single
+frames, 1024-byte status bursts, bursts split into small reads and noisy
+streams.
+
+    python scripts/benchmark.py                      # print results
+    python scripts/benchmark.py --save               # record a new baseline
+    python scripts/benchmark.py --compare            # fail on regressions
+
+Baselines are machine specific: record one on the machine you compare on.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+
+import _integration
+
+client_module = _integration.load("client")
+framing = _integration.load("framing")
+
+BASELINE = Path(__file__).with_name("benchmark_baseline.json")
+
+SINGLE_FRAME = b"(VOL 30)\r\n"
+STATUS_FRAMES = [b"(PWR 1)\r\n", b"(VOL 42)\r\n", b"(MUT 0)\r\n", b"(INP 12)\r\n"]
+NOISE = b"\x00\xff)x\r\n"
+
+
+def _burst(size: int = 1024, noisy: bool = False) -> tuple[bytes, int]:
+    """Return about ``size`` bytes of status frames and the frame count."""
+    data = bytearray()
+    frames = 0
+    while len(data) < size:
+        if noisy and frames % 3 == 0:
+            data += NOISE
+        data += STATUS_FRAMES[frames % len(STATUS_FRAMES)]
+        frames += 1
+    return bytes(data), frames
+
+
+def _chunks(data: bytes, size: int) -> list[bytes]:
+    """Split data into reads of ``size`` bytes."""
+    return [data[offset : offset + size] for offset in range(0, len(data), size)]
+
+
+def _new_client():
+    """Return a client that is not connected and has no callback."""
+    return client_module.McIntoshC2800Client("127.0.0.1", 0)
+
+
+def bench_frame_single(loops: int) -> tuple[int, int]:
+    """Frame one complete message per read."""
+    buffer = framing.FrameBuffer()
+    feed = buffer.feed
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        feed(SINGLE_FRAME)
+    return time.perf_counter_ns() - start, loops
+
+
+def _bench_frame_reads(reads: list[bytes], frames: int, loops: int) -> tuple[int, int]:
+    """Frame a sequence of reads repeatedly."""
+    buffer = framing.FrameBuffer()
+    feed = buffer.feed
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        for data in reads:
+            feed(data)
+    return time.perf_counter_ns() - start, frames * loops
+
+
+def bench_frame_burst(loops: int) -> tuple[int, int]:
+    """Frame 1024-byte reads full of status frames."""
+    data, frames = _burst()
+    return _bench_frame_reads([data], frames, loops // frames or 1)
+
+
+def bench_frame_split(loops: int) -> tuple[int, int]:
+    """Frame a burst delivered in 7-byte reads, splitting most frames."""
+    data, frames = _burst()
+    return _bench_frame_reads(_chunks(data, 7), frames, loops // frames or 1)
+
+
+def bench_frame_noisy(loops: int) -> tuple[int, int]:
+    """Frame a burst with noise between frames."""
+    data, frames = _burst(noisy=True)
+    return _bench_frame_reads([data], frames, loops // frames or 1)
+
+
+async def bench_parse(loops: int) -> tuple[int, int]:
+    """Decode status messages that have already been framed."""
+    client = _new_client()
+    parse = client._parse_response
+    messages = [frame.strip()[1:-1].decode() for frame in STATUS_FRAMES]
+    rounds = loops // len(messages) or 1
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        for message in messages:
+            parse(message)
+    return time.perf_counter_ns() - start, rounds * len(messages)
+
+
+async def bench_receive_path(loops: int) -> tuple[int, int]:
+    """Frame, decode and parse 1024-byte bursts as the read loop does."""
+    client = _new_client()
+    parse = client._parse_response
+    buffer = framing.FrameBuffer()
+    data, frames = _burst()
+    rounds = loops // frames or 1
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        for frame in buffer.feed(data):
+            parse(frame.decode("ascii", errors="ignore"))
+    return time.perf_counter_ns() - start, rounds * frames
+
+
+async def bench_send_command(loops: int) -> tuple[int, int]:
+    """Encode and write commands to a local socket that discards them."""
+
+    finished = asyncio.Event()
+
+    async def discard(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while await reader.read(65536):
+            pass
+        writer.close()
+        finished.set()
+
+    server = await asyncio.start_server(discard, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    # Unlimited rate, so the benchmark measures the write path and not pacing
+    client = client_module.McIntoshC2800Client("127.0.0.1", port, command_rate=0)
+    # Attach a bare connection; connect() would also start the read loop
+    client._reader, client._writer = await asyncio.open_connection("127.0.0.1", port)
+    client._connected = True
+    client._writer_task = asyncio.create_task(client._write_loop())
+    rounds = loops // 10 or 1
+    try:
+        start = time.perf_counter_ns()
+        for index in range(rounds):
+            await client._send_command(f"VOL {index % 100}")
+        elapsed = time.perf_counter_ns() - start
+    finally:
+        await client.disconnect()
+        await finished.wait()
+        server.close()
+        await server.wait_closed()
+    return elapsed, rounds
+
+
+BENCHMARKS: dict[str, Callable[[int], tuple[int, int] | Awaitable[tuple[int, int]]]] = {
+    "frame_single": bench_frame_single,
+    "frame_burst_1k": bench_frame_burst,
+    "frame_split_reads": bench_frame_split,
+    "frame_noisy": bench_frame_noisy,
+    "parse_response": bench_parse,
+    "receive_path_1k": bench_receive_path,
+    "send_command": bench_send_command,
+}
+
+
+async def _measure(name: str, loops: int, repeat: int) -> dict[str, float]:
+    """Run one benchmark several times and summarise ns per operation."""
+    bench = BENCHMARKS[name]
+    samples = []
+    for _ in range(repeat):
+        result = bench(loops)
+        if asyncio.iscoroutine(result):
+            result = await result
+        elapsed, operations = result
+        samples.append(elapsed / operations)
+    return {
+        "ns_per_op": round(statistics.median(samples), 1),
+        "best_ns_per_op": round(min(samples), 1),
+    }
+
+
+async def run(names: list[str], loops: int, repeat: int) -> dict[str, dict[str, float]]:
+    """Run the selected benchmarks."""
+    return {name: await _measure(name, loops, repeat) for name in names}
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Return the benchmarks that are slower than baseline beyond threshold."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["ns_per_op"]
+        after = result["ns_per_op"]
+        change = (after - before) / before
+        marker = "REGRESSION" if change > threshold else "ok"
+        print(f"  {name:20} {before:10.1f} -> {after:10.1f} ns/op  {change:+7.1%}  {marker}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks and optionally save or compare a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "benchmarks", nargs="*", metavar="BENCHMARK", help=f"one of {', '.join(BENCHMARKS)}"
+    )
+    parser.add_argument("--loops", type=int, default=20000, help="operations per sample")
+    parser.add_argument("--repeat", type=int, default=7, help="samples per benchmark")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="write results as baseline")
+    parser.add_argument("--compare", action="store_true", help="compare with baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)"
+    )
+    args = parser.parse_args()
+
+    names = args.benchmarks or list(BENCHMARKS)
+    if unknown := set(names) - BENCHMARKS.keys():
+        parser.error(f"unknown benchmark: {', '.join(sorted(unknown))}")
+    results = asyncio.run(run(names, args.loops, args.repeat))
+    for name, result in results.items():
+        print(f"{name:20} {result['ns_per_op']:10.1f} ns/op (best {result['best_ns_per_op']:.1f})")
+
+    if args.save:
+        document = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        print(f"Compared with {args.baseline} (threshold {args.threshold:.0%}):")
+        if regressions := compare(results, baseline, args.threshold):
+            print(f"Regressed: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+"""Load test with many simulated preamplifiers in one event loop.
+
+Starts N simulated devices and, in the same event loop, one stack per
+device as a config entry would create it: a connected client with its read,
+writer and watchdog tasks, plus the coordinator's timers around it (status
+polling when push updates are off, the parameter read after connecting and
+the reconnect loop with its backoff). Every stack also sends a user command
+at a fixed interval. For each N the test reports:
+
+- connect time and resident memory per device (client and simulator side),
+- CPU time per device and event-loop lag while running,
+- user command round-trip percentiles and failures,
+- recovery time and lag when every device drops its connection at once.
+
+    python scripts/loadtest.py                      # 10, 50, 100 and 200 devices
+    python scripts/loadtest.py --devices 500 --duration 30
+    python scripts/loadtest.py --poll               # poll instead of push updates
+    python scripts/loadtest.py --no-storm
+
+Home Assistant is not needed: the coordinator's timers are reproduced here
+with its constants, and reconnects back off through the same
+reconnect_delay, so the numbers cover the protocol stack rather than entity
+updates in Home Assistant.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import resource
+import sys
+import time
+
+import _integration
+import simulator
+
+client_module = _integration.load("client")
+codec = _integration.load("codec")
+const = _integration.load("const")
+
+LAG_INTERVAL = 0.05  # seconds between event-loop lag samples
+STORM_TIMEOUT = 120  # seconds to wait for every device to reconnect
+
+# Parameters read after connecting, as the coordinator does once per power-on
+PARAMETER_KEYWORDS = [
+    spec.keyword
+    for spec in codec.COMMAND_SPECS
+    if spec.keyword not in client_module.STATUS_QUERIES
+]
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Return the sample below which ``fraction`` of the samples fall."""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def _memory_bytes() -> int:
+    """Return the resident memory of this process."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # Peak rather than current size; kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class EntryStack:
+    """One device as a config entry drives it: client, polling and reconnects."""
+
+    def __init__(self, port: int, poll: bool, command_interval: float) -> None:
+        """Initialize the stack."""
+        self.client = client_module.McIntoshC2800Client(
+            "127.0.0.1", port, self._status_update, push_updates=not poll
+        )
+        self.poll = poll
+        self.command_interval = command_interval
+        self.latencies: list[float] = []
+        self.failures = 0
+        self.reconnects = 0
+        self._tasks: list[asyncio.Task] = []
+        self._reconnect_task: asyncio.Task | None = None
+
+    async def start(self) -> bool:
+        """Connect and start the periodic tasks."""
+        if not await self.client.connect():
+            return False
+        await self._read_parameters()
+        if self.poll:
+            self._tasks.append(asyncio.create_task(self._poll_loop()))
+        if self.command_interval:
+            self._tasks.append(asyncio.create_task(self._command_loop()))
+        return True
+
+    async def stop(self) -> None:
+        """Stop the tasks and disconnect."""
+        for task in [*self._tasks, self._reconnect_task]:
+            if task:
+                task.cancel()
+        await self.client.disconnect()
+
+    def _status_update(self, changed: frozenset[str]) -> None:
+        """Start reconnecting when the connection is lost."""
+        if not self.client.connected and (
+            self._reconnect_task is None or self._reconnect_task.done()
+        ):
+            self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+
+    async def _read_parameters(self) -> None:
+        """Read every parameter once, as after a power-on."""
+        await asyncio.gather(
+            *(
+                self.client.request(keyword, priority=client_module.PRIORITY_POLL)
+                for keyword in PARAMETER_KEYWORDS
+            ),
+            return_exceptions=True,
+        )
+
+    async def _poll_loop(self) -> None:
+        """Query the status at the coordinator's poll interval."""
+        await asyncio.sleep(random.uniform(0, const.POLL_INTERVAL))
+        while True:
+            if self.client.connected:
+                await self.client.query_status()
+            await asyncio.sleep(const.POLL_INTERVAL)
+
+    async def _command_loop(self) -> None:
+        """Set the volume at a fixed interval and time the acknowledgement."""
+        await asyncio.sleep(random.uniform(0, self.command_interval))
+        while True:
+            if self.client.connected:
+                started = time.perf_counter()
+                if await self.client.set_volume(random.randint(10, 60)):
+                    self.latencies.append((time.perf_counter() - started) * 1000)
+                else:
+                    self.failures += 1
+            await asyncio.sleep(self.command_interval)
+
+    async def _reconnect_loop(self) -> None:
+        """Reconnect with the coordinator's backoff and refresh the state."""
+        attempt = 0
+        while not self.client.connected:
+            # The coordinator's backoff, with the default maximum delay
+            await asyncio.sleep(client_module.reconnect_delay(attempt))
+            attempt += 1
+            if await self.client.connect():
+                self.reconnects += 1
+                await self._read_parameters()
+
+
+class LagMonitor:
+    """Measure how late the event loop wakes a periodic sleeper."""
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        if self._task:
+            self._task.cancel()
+
+    def take(self) -> list[float]:
+        """Return the samples taken since the last call, in milliseconds."""
+        samples, self.samples = self.samples, []
+        return samples
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(LAG_INTERVAL)
+            self.samples.append((loop.time() - started - LAG_INTERVAL) * 1000)
+
+
+async def _turn_knobs(devices: list[simulator.SimulatedPreamp], interval: float) -> None:
+    """Change each device's volume at an interval to generate status pushes."""
+    while True:
+        await asyncio.sleep(interval)
+        for device in devices:
+            device.set_state(volume=random.randint(10, 60))
+
+
+async def run_step(count: int, args: argparse.Namespace) -> dict[str, float]:
+    """Run one load level and return its measurements."""
+    devices = [
+        simulator.SimulatedPreamp(faults=simulator.FaultProfile(args.latency))
+        for _ in range(count)
+    ]
+    for device in devices:
+        await device.start()
+
+    monitor = LagMonitor()
+    monitor.start()
+    result: dict[str, float] = {"devices": count}
+
+    # Setup: every entry connects at the same time, as after a restart
+    memory_before = _memory_bytes()
+    stacks = [EntryStack(device.port, args.poll, args.command_interval) for device in devices]
+    started = time.perf_counter()
+    connected = await asyncio.gather(*(stack.start() for stack in stacks))
+    result["connect_s"] = time.perf_counter() - started
+    result["memory_kib"] = (_memory_bytes() - memory_before) / count / 1024
+    result["connect_failures"] = connected.count(False)
+
+    # Steady state
+    knobs = None
+    if args.push_interval:
+        knobs = asyncio.create_task(_turn_knobs(devices, args.push_interval))
+    for stack in stacks:
+        stack.latencies.clear()
+    monitor.take()
+    cpu_started, started = time.process_time(), time.perf_counter()
+    await asyncio.sleep(args.duration)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    result["cpu_percent"] = cpu / elapsed * 100
+    result["cpu_ms_per_device_s"] = cpu * 1000 / elapsed / count
+    lag = monitor.take()
+    result["lag_p50_ms"] = _percentile(lag, 0.5)
+    result["lag_p99_ms"] = _percentile(lag, 0.99)
+    result["lag_max_ms"] = max(lag, default=float("nan"))
+    latencies = [latency for stack in stacks for latency in stack.latencies]
+    result["commands"] = len(latencies)
+    result["command_failures"] = sum(stack.failures for stack in stacks)
+    for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1.0)):
+        result[f"command_{name}_ms"] = _percentile(latencies, fraction)
+
+    # Reconnect storm: every device drops its connection at once
+    if args.storm:
+        cpu_started, started = time.process_time(), time.perf_counter()
+        for device in devices:
+            device.disconnect_all()
+        deadline = started + STORM_TIMEOUT
+        while time.perf_counter() < deadline and not all(
+            stack.reconnects and stack.client.connected for stack in stacks
+        ):
+            await asyncio.sleep(0.05)
+        result["storm_recovery_s"] = time.perf_counter() - started
+        result["storm_cpu_s"] = time.process_time() - cpu_started
+        result["storm_lag_max_ms"] = max(monitor.take(), default=float("nan"))
+        result["storm_unrecovered"] = sum(not stack.client.connected for stack in stacks)
+
+    if knobs:
+        knobs.cancel()
+    monitor.stop()
+    for stack in stacks:
+        await stack.stop()
+    for device in devices:
+        await device.stop()
+    return result
+
+
+def _print_result(result: dict[str, float]) -> None:
+    """Print the measurements of one load level."""
+    print(
+        f"{int(result['devices']):5} devices: connect {result['connect_s']:.2f} s "
+        f"({int(result['connect_failures'])} failed), "
+        f"{result['memory_kib']:.1f} KiB per device"
+    )
+    print(
+        f"      cpu {result['cpu_percent']:.1f}% "
+        f"({result['cpu_ms_per_device_s']:.3f} ms per device-second), "
+        f"loop lag p50 {result['lag_p50_ms']:.1f} / p99 {result['lag_p99_ms']:.1f} "
+        f"/ max {result['lag_max_ms']:.1f} ms"
+    )
+    print(
+        f"      {int(result['commands'])} commands "
+        f"({int(result['command_failures'])} failed): "
+        f"p50 {result['command_p50_ms']:.1f} / p95 {result['command_p95_ms']:.1f} "
+        f"/ p99 {result['command_p99_ms']:.1f} / max {result['command_max_ms']:.1f} ms"
+    )
+    if "storm_recovery_s" in result:
+        print(
+            f"      reconnect storm: all back in {result['storm_recovery_s']:.2f} s "
+            f"({int(result['storm_unrecovered'])} not), cpu {result['storm_cpu_s']:.2f} s, "
+            f"max loop lag {result['storm_lag_max_ms']:.1f} ms"
+        )
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run every load level in turn."""
+    for count in args.devices:
+        _print_result(await run_step(count, args))
+
+
+def main() -> int:
+    """Parse arguments and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--devices",
+        type=lambda value: [int(count) for count in value.split(",")],
+        default=[10, 50, 100, 200],
+        help="comma-separated device counts",
+    )
+    parser.add_argument("--duration", type=float, default=10, help="seconds per level")
+    parser.add_argument("--poll", action="store_true", help="poll instead of push updates")
+    parser.add_argument(
+        "--command-interval", type=float, default=2, help="seconds between user commands"
+    )
+    parser.add_argument(
+        "--push-interval", type=float, default=1, help="seconds between knob turns (0 = none)"
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated reply latency")
+    parser.add_argument("--no-storm", dest="storm", action="store_false")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+    # Dropped connections are expected in the storm; only show real problems
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.ERROR)
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
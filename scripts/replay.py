@@ -0,0 +1,106 @@
+"""Replay a traffic capture through the client's receive path.
+
+Feeds the received bytes of a capture written by the ``dump_capture``
+service back through framing and ``_parse_response`` of a client that is
+not connected, in the original reads, either at the recorded pace or as
+fast as possible. Reproduces field problems offline and measures the
+receive path on real traffic.
+
+    python scripts/replay.py capture.txt             # recorded pace
+    python scripts/replay.py capture.txt --fast      # as fast as possible
+    python scripts/replay.py capture.txt --fast --repeat 20
+    python scripts/replay.py capture.txt -v          # show frames and updates
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+import time
+
+import _integration
+
+capture_module = _integration.load("capture")
+client_module = _integration.load("client")
+
+
+async def replay(
+    records: list[tuple[float, str, bytes]], fast: bool, verbose: bool
+) -> tuple[client_module.McIntoshC2800Client, float]:
+    """Replay the received bytes once; return the client and elapsed seconds."""
+
+    def status_update(changed: frozenset[str]) -> None:
+        if verbose and changed:
+            values = ", ".join(
+                f"{field}={client.state.get(field)!r}" for field in sorted(changed)
+            )
+            print(f"          update: {values}")
+
+    client = client_module.McIntoshC2800Client("127.0.0.1", 0, status_update, capture_size=0)
+    if verbose:
+        client.add_frame_listener(lambda message: print(f"          frame: ({message})"))
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    perf_start = time.perf_counter()
+    for offset, direction, data in records:
+        if not fast:
+            await asyncio.sleep(max(0.0, started + offset - loop.time()))
+        if verbose:
+            print(f"{offset:9.4f} {direction} {data!r}")
+        if direction == capture_module.INBOUND:
+            client._handle_data(data)
+        # Each read is a separate pass of the event loop, as in the read loop
+        await asyncio.sleep(0)
+    return client, time.perf_counter() - perf_start
+
+
+def main() -> int:
+    """Replay a capture file and print what the client made of it."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("capture", type=Path, help="file written by dump_capture")
+    parser.add_argument("--fast", action="store_true", help="ignore the recorded timing")
+    parser.add_argument("--repeat", type=int, default=1, help="replays to time")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        with args.capture.open(encoding="ascii") as file:
+            records = capture_module.parse_capture(file)
+    except (OSError, ValueError) as err:
+        parser.error(str(err))
+
+    received = [record for record in records if record[1] == capture_module.INBOUND]
+    print(
+        f"{args.capture}: {len(received)} reads, {len(records) - len(received)} writes, "
+        f"{records[-1][0] if records else 0:.3f} s"
+    )
+
+    timings = []
+    for run in range(max(args.repeat, 1)):
+        client, elapsed = asyncio.run(replay(records, args.fast, args.verbose and run == 0))
+        timings.append(elapsed)
+
+    metrics = client.metrics
+    print(
+        f"bytes {metrics.bytes_in}, frames {metrics.frames_in}, "
+        f"parse errors {metrics.parse_errors}, dropped bytes {metrics.dropped_bytes}, "
+        f"overflows {metrics.buffer_overflows}, unchanged {metrics.unchanged_reports}"
+    )
+    print(
+        f"status updates {metrics.status_callbacks} "
+        f"({metrics.status_fields} fields, {metrics.coalesced_frames} frames merged)"
+    )
+    print("state:", ", ".join(f"{field}={value!r}" for field, value in client.state.items()))
+    if args.fast and metrics.frames_in:
+        best = min(timings)
+        print(
+            f"replay {best * 1000:.2f} ms best of {len(timings)}, "
+            f"{best * 1e9 / metrics.frames_in:.0f} ns/frame"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,438 @@
+"""Simulated McIntosh C55/C2800 for exercising the integration without hardware.
+
+The simulator speaks the external-control protocol on a TCP port: it answers
+PWR, VOL, MUT, INP and STA commands and the trim, output and tone parameters
+of a C2800, echoes accepted commands, reports errors
+the way the device does and pushes unsolicited status frames when its state
+changes. Faults can be injected to reproduce slow or misbehaving devices:
+per-command latency, replies split into small writes, garbage bytes between
+frames, connections dropped after a number of frames and sockets that stop
+being read.
+
+Run standalone:
+
+    python scripts/simulator.py --port 8484 --latency 0.02 --fragment 3
+
+or start it from another script with ``SimulatedPreamp(...).start()``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import random
+
+_LOGGER = logging.getLogger("simulator")
+
+NUM_INPUTS = 16
+
+# Other parameters of a C2800 as raw protocol values. They are stored as sent;
+# U/D (and L/R for balance) step numeric values. Phono and bi-amp settings are
+# left out, as the device rejects them unless a phono input or bi-amped
+# output is selected.
+DEFAULT_PARAMETERS = {
+    "OP1": "1",
+    "OP2": "1",
+    "HPS": "0",
+    "TBA": "0",
+    "TIN": "0",
+    "TMO": "0",
+    "TPL": "0",
+    "TML": "1",
+    "TDB": "4",
+    "OSM": "0",
+    "OTR": "0",
+    "ODM": "0",
+    "DAM": "PCM 48kHz",
+    "TTN": "0",
+    "TTB": "0",
+    "TTT": "0",
+    "TTL": "1",
+}
+READ_ONLY_PARAMETERS = ("HPS", "DAM")
+STEPS = {"U": 1, "D": -1, "R": 1, "L": -1}
+
+
+@dataclass
+class FaultProfile:
+    """Faults applied to every connection of a simulated device."""
+
+    # Seconds before answering a command, per keyword, with a default
+    latency: float = 0.0
+    command_latency: dict[str, float] = field(default_factory=dict)
+    # Split replies into writes of at most this many bytes (0 disables)
+    fragment_size: int = 0
+    # Probability of emitting noise bytes before a frame
+    garbage_rate: float = 0.0
+    # Close the connection after this many frames have been sent (0 disables)
+    disconnect_after: int = 0
+    # Stop reading from the socket after this many commands (0 disables)
+    stall_after: int = 0
+
+    def latency_for(self, keyword: str) -> float:
+        """Return the reply latency for a command keyword."""
+        return self.command_latency.get(keyword, self.latency)
+
+
+@dataclass
+class PreampState:
+    """Device state as seen through the control protocol."""
+
+    power: bool = True
+    volume: int = 30
+    muted: bool = False
+    source: int = 1
+    status_enabled: bool = True
+    parameters: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_PARAMETERS))
+    # Set while the device is powering up and ignoring other commands
+    warming_up: bool = False
+
+
+class SimulatedConnection:
+    """One control session on the simulated device."""
+
+    def __init__(
+        self,
+        device: SimulatedPreamp,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Initialize the connection."""
+        self._device = device
+        self._reader = reader
+        self._writer = writer
+        self._frames_sent = 0
+        self._commands = 0
+        self._write_lock = asyncio.Lock()
+        self.closed = asyncio.Event()
+
+    async def run(self) -> None:
+        """Read and answer commands until the peer disconnects."""
+        faults = self._device.faults
+        buffer = b""
+        try:
+            while not self.closed.is_set():
+                if faults.stall_after and self._commands >= faults.stall_after:
+                    # Leave the socket unread so the peer's send buffer fills
+                    await self.closed.wait()
+                    break
+                data = await self._reader.read(1024)
+                if not data:
+                    break
+                buffer += data
+                while (end := buffer.find(b")")) != -1:
+                    start = buffer.rfind(b"(", 0, end)
+                    frame, buffer = buffer[start + 1 : end], buffer[end + 1 :]
+                    if start == -1 or not frame.strip():
+                        continue
+                    self._commands += 1
+                    await self._handle(frame.decode("ascii", errors="ignore"))
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the connection."""
+        if not self.closed.is_set():
+            self.closed.set()
+            self._writer.close()
+            self._device.connections.discard(self)
+
+    async def _handle(self, command: str) -> None:
+        """Answer a single command."""
+        parts = command.split()
+        keyword = parts[0].upper()
+        latency = self._device.faults.latency_for(keyword)
+        if latency:
+            await asyncio.sleep(latency)
+        reply, pushed = self._device.execute(keyword, parts[1:])
+        if reply is not None:
+            await self.send(reply)
+        for frame in pushed:
+            await self._device.broadcast(frame, exclude=self)
+
+    async def send(self, message: str) -> None:
+        """Send one frame, applying the configured faults."""
+        if self.closed.is_set():
+            return
+        faults = self._device.faults
+        payload = f"({message})\r\n".encode("ascii")
+        if faults.garbage_rate and random.random() < faults.garbage_rate:
+            noise = bytes(random.choice(b"\x00\xffxyz)\r\n") for _ in range(4))
+            payload = noise + payload
+
+        async with self._write_lock:
+            try:
+                if faults.fragment_size:
+                    size = faults.fragment_size
+                    for offset in range(0, len(payload), size):
+                        self._writer.write(payload[offset : offset + size])
+                        await self._writer.drain()
+                        await asyncio.sleep(0)
+                else:
+                    self._writer.write(payload)
+                    await self._writer.drain()
+            except ConnectionError:
+                self.close()
+                return
+
+        self._frames_sent += 1
+        if faults.disconnect_after and self._frames_sent >= faults.disconnect_after:
+            _LOGGER.info("Dropping connection after %s frames", self._frames_sent)
+            self.close()
+
+
+class SimulatedPreamp:
+    """TCP server emulating a C55/C2800 control port."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: FaultProfile | None = None,
+        state: PreampState | None = None,
+        warmup: float = 0.0,
+        model: str = "C2800",
+    ) -> None:
+        """Initialize the simulated device."""
+        self.host = host
+        self.port = port
+        self.faults = faults or FaultProfile()
+        self.state = state or PreampState()
+        self.warmup = warmup
+        self.model = model
+        self.connections: set[SimulatedConnection] = set()
+        self._server: asyncio.AbstractServer | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start listening for control connections."""
+        self._server = await asyncio.start_server(self._accept, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        _LOGGER.info("Simulated %s listening on %s:%s", self.model, self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop the server and drop every connection."""
+        for connection in list(self.connections):
+            connection.close()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def disconnect_all(self) -> None:
+        """Drop every open connection, as a device reboot would."""
+        for connection in list(self.connections):
+            connection.close()
+
+    async def _accept(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve a new control connection."""
+        connection = SimulatedConnection(self, reader, writer)
+        self.connections.add(connection)
+        await connection.run()
+
+    async def broadcast(
+        self, message: str, exclude: SimulatedConnection | None = None
+    ) -> None:
+        """Push a status frame to every connection with status enabled."""
+        if not self.state.status_enabled:
+            return
+        for connection in list(self.connections):
+            if connection is not exclude:
+                await connection.send(message)
+
+    def set_state(self, **changes) -> None:
+        """Change state as the front panel or remote would, pushing updates."""
+        frames = []
+        for name, value in changes.items():
+            if getattr(self.state, name) != value:
+                setattr(self.state, name, value)
+                frames.append(self._status(_KEYWORDS[name]))
+        self._spawn(self._broadcast_all(frames))
+
+    async def _broadcast_all(self, frames: list[str]) -> None:
+        """Push several status frames in order."""
+        for frame in frames:
+            await self.broadcast(frame)
+
+    def _spawn(self, coro) -> None:
+        """Run a coroutine in the background, keeping a reference to it."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _status(self, keyword: str) -> str:
+        """Return the status frame for a keyword."""
+        state = self.state
+        if keyword in state.parameters:
+            return f"{keyword} {state.parameters[keyword]}"
+        value = {
+            "PWR": int(state.power and not state.warming_up),
+            "VOL": state.volume,
+            "MUT": int(state.muted),
+            "INP": state.source,
+            "STA": int(state.status_enabled),
+        }[keyword]
+        return f"{keyword} {value}"
+
+    def execute(self, keyword: str, args: list[str]) -> tuple[str | None, list[str]]:
+        """Apply a command and return the reply and frames for other sessions."""
+        state = self.state
+        if keyword not in ("PWR", "VOL", "MUT", "INP", "STA", *state.parameters):
+            return "ERROR Invalid Command", []
+        if keyword != "PWR" and (not state.power or state.warming_up):
+            return "ERROR Invalid Command", []
+        if not args:
+            return self._status(keyword), []
+
+        arg = args[0].upper()
+        try:
+            if keyword == "PWR":
+                power = _parse_bool(arg)
+                if power and not state.power and self.warmup:
+                    state.power = state.warming_up = True
+                    self._spawn(self._finish_warmup())
+                    # PWR 1 is only reported once the device has warmed up
+                    return None, []
+                state.power = power
+            elif keyword == "VOL":
+                if arg == "U":
+                    state.volume = min(state.volume + 1, 100)
+                elif arg == "D":
+                    state.volume = max(state.volume - 1, 0)
+                else:
+                    state.volume = _parse_range(arg, 0, 100)
+            elif keyword == "MUT":
+                state.muted = _parse_bool(arg)
+            elif keyword == "INP":
+                if arg == "U":
+                    state.source = state.source % NUM_INPUTS + 1
+                elif arg == "D":
+                    state.source = (state.source - 2) % NUM_INPUTS + 1
+                else:
+                    state.source = _parse_range(arg, 1, NUM_INPUTS)
+            elif keyword == "STA":
+                state.status_enabled = _parse_bool(arg)
+            elif keyword in READ_ONLY_PARAMETERS:
+                return "ERROR Invalid Command", []
+            elif arg in STEPS:
+                state.parameters[keyword] = str(int(state.parameters[keyword]) + STEPS[arg])
+            else:
+                state.parameters[keyword] = " ".join(args)
+        except ValueError:
+            return "ERROR Invalid Parameter", []
+
+        status = self._status(keyword)
+        return status, [status]
+
+    async def _finish_warmup(self) -> None:
+        """Complete a power-up and push the resulting state burst."""
+        await asyncio.sleep(self.warmup)
+        self.state.warming_up = False
+        for keyword in ("PWR", "VOL", "MUT", "INP"):
+            await self.broadcast(self._status(keyword))
+
+
+_KEYWORDS = {
+    "power": "PWR",
+    "volume": "VOL",
+    "muted": "MUT",
+    "source": "INP",
+    "status_enabled": "STA",
+}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a 0/1 protocol flag."""
+    if value not in ("0", "1"):
+        raise ValueError(value)
+    return value == "1"
+
+
+def _parse_range(value: str, minimum: int, maximum: int) -> int:
+    """Parse an integer parameter within a range."""
+    number = int(value)
+    if not minimum <= number <= maximum:
+        raise ValueError(value)
+    return number
+
+
+async def _knob_spin(device: SimulatedPreamp, interval: float) -> None:
+    """Keep turning the volume knob to generate unsolicited frames."""
+    direction = 1
+    while True:
+        await asyncio.sleep(interval)
+        volume = device.state.volume + direction
+        if not 0 <= volume <= 100:
+            direction = -direction
+            volume = device.state.volume + direction
+        device.set_state(volume=volume)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    """Run simulated devices until interrupted."""
+    faults = FaultProfile(
+        latency=args.latency,
+        fragment_size=args.fragment,
+        garbage_rate=args.garbage,
+        disconnect_after=args.disconnect_after,
+        stall_after=args.stall_after,
+    )
+    devices = []
+    for index in range(args.count):
+        device = SimulatedPreamp(
+            host=args.host,
+            port=args.port + index if args.port else 0,
+            faults=faults,
+            warmup=args.warmup,
+            state=PreampState(power=not args.off),
+        )
+        await device.start()
+        devices.append(device)
+        print(f"{device.model} simulator listening on {device.host}:{device.port}")
+
+    tasks = [
+        asyncio.create_task(_knob_spin(device, args.push_interval))
+        for device in devices
+        if args.push_interval
+    ]
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for task in tasks:
+            task.cancel()
+        for device in devices:
+            await device.stop()
+
+
+def main() -> None:
+    """Parse arguments and run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8484, help="0 picks a free port")
+    parser.add_argument("--count", type=int, default=1, help="devices on consecutive ports")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per reply")
+    parser.add_argument("--fragment", type=int, default=0, help="max bytes per write")
+    parser.add_argument("--garbage", type=float, default=0.0, help="noise probability per frame")
+    parser.add_argument("--disconnect-after", type=int, default=0, help="frames per session")
+    parser.add_argument("--stall-after", type=int, default=0, help="commands before reads stop")
+    parser.add_argument("--warmup", type=float, default=0.0, help="power-up delay in seconds")
+    parser.add_argument("--push-interval", type=float, default=0.0, help="seconds between knob steps")
+    parser.add_argument("--off", action="store_true", help="start powered off")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
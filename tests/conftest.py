@@ -0,0 +1,9 @@
+"""Test configuration.
+
+The protocol modules are imported without Home Assistant through the same
+loader the scripts use.
+"""
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
@@ -0,0 +1,135 @@
+"""Tests for reply matching in McIntoshC2800Client, against the simulator."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import _integration
+import simulator
+
+client_module = _integration.load("client")
+McIntoshC2800Client = client_module.McIntoshC2800Client
+McIntoshC2800CommandError = client_module.McIntoshC2800CommandError
+
+
+async def start(**client_options) -> tuple[simulator.SimulatedPreamp, McIntoshC2800Client]:
+    """Start a simulated device and a connected client without push updates."""
+    device = simulator.SimulatedPreamp()
+    await device.start()
+    client = McIntoshC2800Client("127.0.0.1", device.port, **client_options)
+    assert await client.connect()
+    return device, client
+
+
+async def stop(device: simulator.SimulatedPreamp, client: McIntoshC2800Client) -> None:
+    """Disconnect the client and stop the device."""
+    await client.disconnect()
+    await device.stop()
+
+
+def test_error_for_unawaited_write_does_not_fail_query() -> None:
+    """A rejected fire-and-forget command leaves a later query its reply."""
+
+    async def run() -> None:
+        device, client = await start()
+        try:
+            assert await client.send_command("FOO 1")
+            assert await client.request("VOL", timeout=2) == "30"
+            assert client.metrics.device_errors == 1
+        finally:
+            await stop(device, client)
+
+    asyncio.run(run())
+
+
+def test_echo_of_unawaited_write_does_not_answer_query() -> None:
+    """A query written after a command gets its own reply, not the echo."""
+
+    async def run() -> None:
+        device, client = await start()
+        try:
+            assert await client.send_command("VOL 40")
+            with pytest.raises(McIntoshC2800CommandError):
+                await client.request("FOO", timeout=2)
+            assert await client.request("VOL", timeout=2) == "40"
+            assert client.last_push == 0
+        finally:
+            await stop(device, client)
+
+    asyncio.run(run())
+
+
+def test_unanswered_write_is_given_up() -> None:
+    """A write whose reply never comes stops taking replies meant for others."""
+
+    async def run() -> None:
+        device, client = await start(
+            power_on_hold=0, min_timeout=0.05, max_timeout=0.05
+        )
+        try:
+            device.state.power = False
+            device.warmup = 10
+            # The device stays silent while warming up
+            assert await client.send_command("PWR 1")
+            await asyncio.sleep(0.1)
+            device.state.warming_up = False
+            assert await client.request("PWR", timeout=2) == "1"
+        finally:
+            await stop(device, client)
+
+    asyncio.run(run())
+
+
+def test_proxy_error_does_not_fail_query() -> None:
+    """A controller's rejected command through the proxy is not charged to HA."""
+
+    async def run() -> None:
+        device, client = await start()
+        proxy = _integration.load("proxy").McIntoshC2800Proxy(client, 0, "127.0.0.1")
+        try:
+            assert await proxy.async_start()
+            port = proxy._server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"(FOO 1)\r\n")
+            await writer.drain()
+            # The controller sees the device's answer to its own command
+            reply = await asyncio.wait_for(reader.readuntil(b")"), 2)
+            assert reply == b"(ERROR Invalid Command)"
+            # The device rejects the controller's BAR only after the query
+            # below has been written behind it
+            device.faults.command_latency["BAR"] = 0.2
+            writer.write(b"(BAR)\r\n")
+            await writer.drain()
+            await asyncio.sleep(0.05)
+            assert await client.request("MUT", timeout=2) == "0"
+            writer.close()
+        finally:
+            await proxy.async_stop()
+            await stop(device, client)
+
+    asyncio.run(run())
+
+
+def test_connect_fails_against_silent_peer() -> None:
+    """A peer that never answers is not reported as a connected device."""
+
+    async def run() -> None:
+        async def swallow(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            while await reader.read(1024):
+                pass
+            writer.close()
+
+        server = await asyncio.start_server(swallow, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = McIntoshC2800Client("127.0.0.1", port, min_timeout=0.05, max_timeout=0.05)
+        try:
+            assert not await client.connect()
+            assert not client.connected
+            assert client.link_timed_out
+        finally:
+            await client.disconnect()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
@@ -0,0 +1,97 @@
+"""Tests for FrameBuffer."""
+from __future__ import annotations
+
+import pytest
+
+import _integration
+
+framing = _integration.load("framing")
+FrameBuffer = framing.FrameBuffer
+
+
+def feed_all(buffer: FrameBuffer, chunks: list[bytes]) -> list[bytes]:
+    """Feed chunks in turn and return every frame produced."""
+    frames = []
+    for chunk in chunks:
+        frames.extend(buffer.feed(chunk))
+    return frames
+
+
+def test_complete_frames() -> None:
+    """Frames in one read are returned in order, noise between them dropped."""
+    buffer = FrameBuffer()
+    assert buffer.feed(b"(PWR 1)\r\n(VOL 30)\r\n") == [b"PWR 1", b"VOL 30"]
+    assert buffer.dropped_bytes == 4
+    assert len(buffer) == 0
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5])
+def test_frames_split_across_reads(size: int) -> None:
+    """A frame split at any byte boundary is reassembled."""
+    data = b"(PWR 1)\r\n(MUT 0)\r\n(INP 3)\r\n"
+    buffer = FrameBuffer()
+    chunks = [data[i : i + size] for i in range(0, len(data), size)]
+    assert feed_all(buffer, chunks) == [b"PWR 1", b"MUT 0", b"INP 3"]
+    assert buffer.dropped_bytes == 6
+    assert buffer.overflows == 0
+
+
+def test_partial_frame_is_kept() -> None:
+    """An open frame waits for the rest of its bytes."""
+    buffer = FrameBuffer()
+    assert buffer.feed(b"(VOL") == []
+    assert len(buffer) == 4
+    assert buffer.feed(b" 45)") == [b"VOL 45"]
+    assert len(buffer) == 0
+
+
+def test_unbalanced_open_resynchronises() -> None:
+    """A "(" inside an open frame starts over from the new start byte."""
+    buffer = FrameBuffer()
+    assert buffer.feed(b"(VOL (MUT 1)") == [b"MUT 1"]
+    assert buffer.dropped_bytes == 5
+
+
+def test_unbalanced_open_across_reads() -> None:
+    """Resynchronising also works when the new "(" arrives in a later read."""
+    buffer = FrameBuffer()
+    assert buffer.feed(b"(PW") == []
+    assert buffer.feed(b"(PWR 0)") == [b"PWR 0"]
+    assert buffer.dropped_bytes == 3
+
+
+def test_nested_parens() -> None:
+    """Nested frames yield the innermost one; the stray ")" is noise."""
+    buffer = FrameBuffer()
+    assert buffer.feed(b"((INP 2))") == [b"INP 2"]
+    assert buffer.dropped_bytes == 2
+
+
+def test_stray_close_is_dropped() -> None:
+    """A ")" outside a frame is skipped."""
+    buffer = FrameBuffer()
+    assert buffer.feed(b")(MUT 1)") == [b"MUT 1"]
+    assert buffer.dropped_bytes == 1
+
+
+def test_overflow_recovery() -> None:
+    """An unterminated frame past the limit is discarded and the stream continues."""
+    buffer = FrameBuffer(max_frame_length=16)
+    assert buffer.feed(b"(" + b"x" * 10) == []
+    assert buffer.overflows == 0
+    assert buffer.feed(b"x" * 10) == []
+    assert buffer.overflows == 1
+    assert buffer.dropped_bytes == 21
+    assert len(buffer) == 0
+    # The rest of the unterminated frame is noise until the next "("
+    assert buffer.feed(b"xx)(PWR 1)") == [b"PWR 1"]
+    assert buffer.dropped_bytes == 24
+    assert buffer.overflows == 1
+
+
+def test_reset_discards_partial_frame() -> None:
+    """reset() drops an open frame so the next read starts clean."""
+    buffer = FrameBuffer()
+    buffer.feed(b"(VOL 3")
+    buffer.reset()
+    assert buffer.feed(b"0)(MUT 0)") == [b"MUT 0"]